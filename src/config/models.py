@@ -29,7 +29,7 @@ class DataProvider(str, Enum):
 DataSource = DataProvider  # 向后兼容别名
 
 
-@dataclass
+@dataclass(slots=True)
 class Fund:
     """基金基础模型"""
 
@@ -45,7 +45,7 @@ class Fund:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Holding(Fund):
     """持仓模型"""
 
@@ -58,7 +58,7 @@ class Holding(Fund):
         return self.shares * self.cost
 
 
-@dataclass
+@dataclass(slots=True)
 class Commodity:
     """商品模型"""
 
@@ -141,7 +141,7 @@ class AlertDirection(str, Enum):
     BELOW = "below"  # 低于目标价
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceAlert:
     """价格预警模型"""
 
@@ -35,15 +35,10 @@ class AKShareEconomicNewsDataSource(DataSource):
         super().__init__(
             name="akshare_economic_news", source_type=DataSourceType.NEWS, timeout=timeout
         )
-        self._cache: list[dict[str, Any]] = []  # type: ignore[assignment]
-        self._cache_time: float = 0.0
+        # 按日期分别缓存: {date: {"data": [...], "_cache_time": ts}}
+        self._cache: dict[str, dict[str, Any]] = {}
         self._cache_timeout = 300.0  # 缓存5分钟
 
-    @property
-    def _cache_type(self) -> str:
-        """List 缓存类型"""
-        return "list"
-
     async def fetch(self, date: str | None = None) -> DataSourceResult:
         """
         获取全球宏观事件（财经日历）
@@ -57,14 +52,27 @@ class AKShareEconomicNewsDataSource(DataSource):
         # 检查缓存
         cache_key = date or self.DEFAULT_DATE
         if self._is_cache_valid(cache_key):
-            return DataSourceResult(
-                success=True,
-                data=self._cache,
-                timestamp=self._cache_time,
-                source=self.name,
-                metadata={"from_cache": True, "date": date or self.DEFAULT_DATE},
-            )
+            return self._cached_result(cache_key)
+
+        async with self._get_fetch_lock(cache_key):
+            # 双重检查：等待锁期间其他协程可能已经刷新了缓存
+            if self._is_cache_valid(cache_key):
+                return self._cached_result(cache_key)
+            return await self._fetch_uncached(cache_key)
+
+    def _cached_result(self, cache_key: str) -> DataSourceResult:
+        """构造缓存命中结果"""
+        entry = self._cache[cache_key]
+        return DataSourceResult(
+            success=True,
+            data=entry["data"],
+            timestamp=entry["_cache_time"],
+            source=self.name,
+            metadata={"from_cache": True, "date": cache_key},
+        )
 
+    async def _fetch_uncached(self, date: str) -> DataSourceResult:
+        """从 AKShare 获取财经事件并更新缓存"""
         try:
             # 在线程池中运行同步的 akshare 调用
             loop = asyncio.get_event_loop()
@@ -74,9 +82,8 @@ class AKShareEconomicNewsDataSource(DataSource):
                 # 转换为字典列表
                 data = df.to_dict(orient="records")
 
-                # 更新缓存
-                self._cache = data
-                self._cache_time = time.time()
+                # 更新该日期的缓存
+                self._cache[date] = {"data": data, "_cache_time": time.time()}
 
                 self._record_success()
                 return DataSourceResult(
@@ -84,7 +91,7 @@ class AKShareEconomicNewsDataSource(DataSource):
                     data=data,
                     timestamp=time.time(),
                     source=self.name,
-                    metadata={"date": date or self.DEFAULT_DATE, "count": len(data)},
+                    metadata={"date": date, "count": len(data)},
                 )
 
             return DataSourceResult(
@@ -92,7 +99,7 @@ class AKShareEconomicNewsDataSource(DataSource):
                 error="未获取到财经事件数据",
                 timestamp=time.time(),
                 source=self.name,
-                metadata={"date": date or self.DEFAULT_DATE},
+                metadata={"date": date},
             )
 
         except Exception as e:
@@ -161,14 +168,18 @@ class AKShareWeiboSentimentDataSource(DataSource):
         super().__init__(
             name="akshare_weibo_sentiment", source_type=DataSourceType.NEWS, timeout=timeout
         )
-        self._cache: list[dict[str, Any]] = []  # type: ignore[assignment]
-        self._cache_time: float = 0.0
+        # 按周期分别缓存: {period: {"data": [...], "_cache_time": ts}}
+        self._cache: dict[str, dict[str, Any]] = {}
         self._cache_timeout = 180.0  # 缓存3分钟
-
-    @property
-    def _cache_type(self) -> str:
-        """List 缓存类型"""
-        return "list"
+        # 短周期榜单变化更快，按周期设置缓存有效期
+        self._cache_timeouts = {
+            "2h": 60.0,
+            "6h": 120.0,
+            "12h": 180.0,
+            "24h": 300.0,
+            "7d": 900.0,
+            "30d": 1800.0,
+        }
 
     async def fetch(self, period: str = "12h") -> DataSourceResult:
         """
@@ -182,14 +193,27 @@ class AKShareWeiboSentimentDataSource(DataSource):
         """
         # 检查缓存
         if self._is_cache_valid(period):
-            return DataSourceResult(
-                success=True,
-                data=self._cache,
-                timestamp=self._cache_time,
-                source=self.name,
-                metadata={"from_cache": True, "period": period},
-            )
+            return self._cached_result(period)
+
+        async with self._get_fetch_lock(period):
+            # 双重检查：等待锁期间其他协程可能已经刷新了缓存
+            if self._is_cache_valid(period):
+                return self._cached_result(period)
+            return await self._fetch_uncached(period)
+
+    def _cached_result(self, period: str) -> DataSourceResult:
+        """构造缓存命中结果"""
+        entry = self._cache[period]
+        return DataSourceResult(
+            success=True,
+            data=entry["data"],
+            timestamp=entry["_cache_time"],
+            source=self.name,
+            metadata={"from_cache": True, "period": period},
+        )
 
+    async def _fetch_uncached(self, period: str) -> DataSourceResult:
+        """从 AKShare 获取微博舆情并更新缓存"""
         try:
             # 转换周期参数
             akshare_period = self.TIME_PERIODS.get(period, self.TIME_PERIODS[self.DEFAULT_PERIOD])
@@ -202,9 +226,8 @@ class AKShareWeiboSentimentDataSource(DataSource):
                 # 转换为字典列表
                 data = df.to_dict(orient="records")
 
-                # 更新缓存
-                self._cache = data
-                self._cache_time = time.time()
+                # 更新该周期的缓存
+                self._cache[period] = {"data": data, "_cache_time": time.time()}
 
                 self._record_success()
                 return DataSourceResult(
@@ -157,7 +157,9 @@ class DataSource(ABC):
         self._error_count = 0
         self._cache: dict[str, Any] = {}
         self._cache_timeout: float = 300.0  # 5 minutes default
+        self._cache_timeouts: dict[str, float] = {}  # 按缓存键覆盖的 TTL
         self._cache_time: float = 0.0
+        self._fetch_locks: dict[str, asyncio.Lock] = {}
 
     @property
     def error_rate(self) -> float:
@@ -190,7 +192,7 @@ class DataSource(ABC):
         Returns:
             List[DataSourceResult]: 返回结果列表
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         async def fetch_one(key: str) -> DataSourceResult:
             return await self.fetch(key)
@@ -220,7 +222,7 @@ class DataSource(ABC):
                 else:
                     fail_count += 1
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         logger.debug(
             "批量获取完成",
             extra={
@@ -234,6 +236,21 @@ class DataSource(ABC):
 
         return processed_results
 
+    def _get_cache_timeout(self, cache_key: str) -> float:
+        """
+        获取缓存键对应的 TTL
+
+        优先使用 _cache_timeouts 中的按键配置，未配置时回退到 _cache_timeout。
+        子类可覆盖此方法实现动态 TTL 策略。
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            float: 缓存有效期(秒)
+        """
+        return self._cache_timeouts.get(cache_key, self._cache_timeout)
+
     def _is_cache_valid(self, cache_key: str) -> bool:
         """
         检查缓存是否有效
@@ -246,15 +263,34 @@ class DataSource(ABC):
         """
         if not hasattr(self, "_cache"):
             return False
+        timeout = self._get_cache_timeout(cache_key)
         if self._cache_type == "list":
             if not self._cache:
                 return False
-            return (time.time() - self._cache_time) < self._cache_timeout
+            return (time.time() - self._cache_time) < timeout
         else:
             if cache_key not in self._cache:
                 return False
             cache_time = self._cache[cache_key].get("_cache_time", 0)
-            return (time.time() - cache_time) < self._cache_timeout
+            return (time.time() - cache_time) < timeout
+
+    def _get_fetch_lock(self, cache_key: str) -> asyncio.Lock:
+        """
+        获取缓存键对应的回源锁
+
+        缓存未命中时持锁回源，并在锁内再次检查缓存，
+        保证同一缓存键的并发请求只触发一次外部调用。
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            asyncio.Lock: 该缓存键的锁
+        """
+        lock = self._fetch_locks.get(cache_key)
+        if lock is None:
+            lock = self._fetch_locks[cache_key] = asyncio.Lock()
+        return lock
 
     @property
     def _cache_type(self) -> str:
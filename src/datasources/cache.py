@@ -103,7 +103,8 @@ class DataCache:
 
         try:
             with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+                # 紧凑分隔符，减小缓存文件体积
+                f.write(json.dumps(cache_data, ensure_ascii=False, separators=(",", ":")))
         except (OSError, TypeError) as e:
             logger.warning(f"缓存写入失败 (key={key}): {e}")
 
@@ -200,7 +200,7 @@ class DualLayerCache:
 
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+                f.write(json.dumps(cache_data, ensure_ascii=False, separators=(",", ":")))
         except (OSError, TypeError) as e:
             logger.warning(f"缓存写入失败 (key={key}): {e}")
 
@@ -9,6 +9,7 @@
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import Any
 
@@ -43,6 +44,40 @@ TOP_HOLDINGS_N = 10
 # 返回的概念标签数量
 TOP_TAGS_N = 5
 
+# 基金名称中的常见概念关键词映射（关键词 -> 标签）
+_NAME_CONCEPT_KEYWORDS: dict[str, str] = {
+    "人工智能": "人工智能", "AI": "AI",
+    "芯片": "芯片", "半导体": "半导体",
+    "机器人": "机器人",
+    "新能源": "新能源", "光伏": "光伏",
+    "白酒": "白酒", "消费": "消费",
+    "医药": "医药", "医疗": "医疗",
+    "煤炭": "煤炭", "能源": "能源",
+    "农业": "农业", "养殖": "养殖",
+    "科技": "科技", "数字经济": "数字经济",
+    "通信": "通信", "5G": "5G",
+    "军工": "军工", "航天": "航天",
+    "红利": "红利", "银行": "银行",
+    "证券": "证券", "保险": "保险",
+    "地产": "地产", "基建": "基建",
+    "有色": "有色金属", "钢铁": "钢铁",
+    "化工": "化工",
+    "纳斯达克": "纳斯达克", "恒生": "恒生",
+    "北证": "北证", "科创": "科创板",
+    "创业板": "创业板",
+    "央企": "央企", "国企": "国企改革",
+    "黄金": "黄金",
+    "绿电": "绿色电力", "电力": "电力",
+    "电池": "电池",
+    "畜牧": "畜牧养殖", "粮食": "粮食",
+    "云计算": "云计算", "大数据": "大数据",
+    "智能": "智能", "高端制造": "高端制造",
+    "沪深300": "沪深300", "中证500": "中证500",
+}
+
+# 关键词合并为单个正则，名称不含任何关键词时一次扫描即可返回
+_NAME_CONCEPT_RE = re.compile("|".join(map(re.escape, _NAME_CONCEPT_KEYWORDS)))
+
 
 def _get_stock_concept_dao() -> StockConceptDAO:
     return StockConceptDAO(DatabaseManager())
@@ -273,6 +308,19 @@ def _get_fund_sector_fallback(fund_code: str) -> str | None:
         return None
 
 
+def _extract_name_concepts(name: str) -> list[str]:
+    """从基金名称提取概念标签，按关键词表顺序返回前 TOP_TAGS_N 个"""
+    if not name or not _NAME_CONCEPT_RE.search(name):
+        return []
+    found = []
+    for word, tag in _NAME_CONCEPT_KEYWORDS.items():
+        if word in name:
+            found.append(tag)
+            if len(found) >= TOP_TAGS_N:
+                break
+    return found
+
+
 def _get_fund_name_fallback(fund_code: str) -> list[str]:
     """兜底2：从基金名称/跟踪标的提取概念关键词"""
     try:
@@ -285,41 +333,7 @@ def _get_fund_name_fallback(fund_code: str) -> list[str]:
                 return []
             name = row[1] or row[0] or ""
 
-        # 常见概念关键词映射
-        keywords = {
-            "人工智能": "人工智能", "AI": "AI",
-            "芯片": "芯片", "半导体": "半导体",
-            "机器人": "机器人",
-            "新能源": "新能源", "光伏": "光伏",
-            "白酒": "白酒", "消费": "消费",
-            "医药": "医药", "医疗": "医疗",
-            "煤炭": "煤炭", "能源": "能源",
-            "农业": "农业", "养殖": "养殖",
-            "科技": "科技", "数字经济": "数字经济",
-            "通信": "通信", "5G": "5G",
-            "军工": "军工", "航天": "航天",
-            "红利": "红利", "银行": "银行",
-            "证券": "证券", "保险": "保险",
-            "地产": "地产", "基建": "基建",
-            "有色": "有色金属", "钢铁": "钢铁",
-            "化工": "化工",
-            "纳斯达克": "纳斯达克", "恒生": "恒生",
-            "北证": "北证", "科创": "科创板",
-            "创业板": "创业板",
-            "央企": "央企", "国企": "国企改革",
-            "黄金": "黄金",
-            "绿电": "绿色电力", "电力": "电力",
-            "电池": "电池",
-            "畜牧": "畜牧养殖", "粮食": "粮食",
-            "云计算": "云计算", "大数据": "大数据",
-            "智能": "智能", "高端制造": "高端制造",
-            "沪深300": "沪深300", "中证500": "中证500",
-        }
-        found = []
-        for word, tag in keywords.items():
-            if word in name:
-                found.append(tag)
-        return found[:TOP_TAGS_N]
+        return _extract_name_concepts(name)
     except Exception:
         return []
 
@@ -16,6 +16,17 @@ logger = logging.getLogger(__name__)
 class FundHistorySource(DataSource):
     """基金历史数据源 - 使用 akshare 获取基金净值历史数据"""
 
+    # 时间周期 -> 回溯天数（"成立以来" 不在表中，返回全部数据）
+    PERIOD_DAYS = {
+        "近一周": 7,
+        "近一月": 30,
+        "近三月": 90,
+        "近六月": 180,
+        "近一年": 365,
+        "近三年": 365 * 3,
+        "近五年": 365 * 5,
+    }
+
     def __init__(self, timeout: float = 30.0):
         """
         初始化基金历史数据源
@@ -135,29 +146,13 @@ class FundHistorySource(DataSource):
         if not data:
             return []
 
-        # 获取当前日期
-        today = datetime.now()
-        cutoff_date: datetime | None = None
-
-        # 根据 period 计算截止日期
-        if period == "近一周":
-            cutoff_date = today - timedelta(days=7)
-        elif period == "近一月":
-            cutoff_date = today - timedelta(days=30)
-        elif period == "近三月":
-            cutoff_date = today - timedelta(days=90)
-        elif period == "近六月":
-            cutoff_date = today - timedelta(days=180)
-        elif period == "近一年":
-            cutoff_date = today - timedelta(days=365)
-        elif period == "近三年":
-            cutoff_date = today - timedelta(days=365 * 3)
-        elif period == "近五年":
-            cutoff_date = today - timedelta(days=365 * 5)
-        else:
+        days = self.PERIOD_DAYS.get(period)
+        if days is None:
             # 成立以来，返回所有数据
             return data
 
+        cutoff_date = datetime.now() - timedelta(days=days)
+
         # 过滤数据
         filtered = []
         for item in data:
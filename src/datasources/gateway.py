@@ -6,7 +6,6 @@
 
 import asyncio
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -25,6 +24,7 @@ from src.datasources.unified_models import (
     DataResponse,
     RequestPriority,
     ResponseStatus,
+    next_request_id,
 )
 
 
@@ -226,7 +226,7 @@ class DataGateway:
         Returns:
             BatchDataResponse: 批量响应
         """
-        batch_id = str(uuid.uuid4())
+        batch_id = next_request_id()
         start_time = time.perf_counter()
 
         if batch.parallel:
@@ -160,7 +160,7 @@ class DataSourceManager:
         Returns:
             DataSourceResult: 第一个成功的数据源结果
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         async with await self._get_semaphore(source_type):
             sources = self._get_ordered_sources(source_type)
             errors = []
@@ -205,7 +205,7 @@ class DataSourceManager:
                         # 更新健康检查状态
                         if health_aware:
                             await self._health_checker.check_source(source)
-                        duration_ms = (time.time() - start_time) * 1000
+                        duration_ms = (time.perf_counter() - start_time) * 1000
                         logger.info(
                             "数据源获取成功",
                             extra={
@@ -242,7 +242,7 @@ class DataSourceManager:
                     )
 
             # 所有数据源都失败
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             if failover and errors:
                 logger.error(
                     "所有数据源均失败",
@@ -362,7 +362,7 @@ class DataSourceManager:
         Returns:
             List[DataSourceResult]: 结果列表
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         sources = self._get_ordered_sources(source_type)
         if not sources:
             logger.warning(
@@ -445,7 +445,7 @@ class DataSourceManager:
                 else:
                     fail_count += 1
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
             "批量获取完成",
             extra={
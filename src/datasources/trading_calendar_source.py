@@ -1,19 +1,27 @@
 import logging
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import cast
 from zoneinfo import ZoneInfo
 
 import httpx
-from holidays import country_holidays
+from holidays import HolidayBase, country_holidays
 
 from src.datasources.base import DataSource, DataSourceResult, DataSourceType
+from src.datasources.cache import DataCache
 
 logger = logging.getLogger(__name__)
 
 SATURDAY = 5
 SUNDAY = 6
 
+# A股真实交易日的磁盘缓存目录
+CALENDAR_CACHE_DIR = Path.home() / ".fund-tui" / "cache" / "calendar"
+
 
 class Market(Enum):
     CHINA = "china"
@@ -30,6 +38,20 @@ class Market(Enum):
     LBMA = "lbma"  # 伦敦金银市场协会
 
 
+def _to_market(market: Market | str) -> Market:
+    """将市场字符串转换为 Market
+
+    直接查枚举的值映射表，避免 Market(value) 的调用开销；
+    未知值仍交给 Market(value) 抛出 ValueError。
+    """
+    if isinstance(market, Market):
+        return market
+    member = Market._value2member_map_.get(market)
+    if member is None:
+        return Market(market)
+    return cast(Market, member)
+
+
 # 各市场时区映射
 MARKET_TIMEZONES: dict[Market, str] = {
     Market.CHINA: "Asia/Shanghai",
@@ -118,10 +140,28 @@ MARKET_TRADING_HOURS = {
 }
 
 
+@lru_cache(maxsize=128)
+def _country_holidays(country_code: str, year: int) -> HolidayBase:
+    """获取国家/地区某年的节假日表（进程内缓存，调用方只读）"""
+    return country_holidays(country_code, years=year)
+
+
+@lru_cache(maxsize=512)
+def _holidays_for(market_value: str, year: int) -> frozenset[date]:
+    """获取市场某年的节假日集合（进程内缓存，异常不会被缓存，由调用方兜底）"""
+    market = Market(market_value)
+    country_code, _ = MARKET_COUNTRY_MAP.get(market, ("US", ["US"]))
+
+    holiday_dates = set(_country_holidays(country_code, year).keys())
+    if market == Market.CHINA:
+        holiday_dates.update(_country_holidays("HK", year).keys())
+
+    return frozenset(holiday_dates)
+
+
 def get_market_date(market: Market | str) -> date:
     """获取市场当前日期（当地时区）"""
-    if isinstance(market, str):
-        market = Market(market)
+    market = _to_market(market)
 
     tz_name = MARKET_TIMEZONES.get(market, "UTC")
     tz = ZoneInfo(tz_name)
@@ -138,7 +178,7 @@ def update_china_special_dates(dates: dict[date, str]) -> None:
     CHINA_SPECIAL_DATES.update(dates)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingDay:
     date: date
     is_trading_day: bool
@@ -147,13 +187,52 @@ class TradingDay:
     market: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarResult:
     year: int
     market: str
     trading_days: list[TradingDay]
     total_trading_days: int
     total_holidays: int
+    # 按日期升序的交易日列表，首次查询时构建
+    _trading_dates: list[date] | None = field(default=None, init=False, repr=False, compare=False)
+    # 交易日位图（第 i 位对应 _first_ordinal + i 那天），首次查询时构建
+    _trading_mask: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    _first_ordinal: int = field(default=0, init=False, repr=False, compare=False)
+
+    def is_trading_date(self, check_date: date) -> bool:
+        """按位图判断某天是否为交易日，不在日历范围内的日期返回 False"""
+        mask = self._trading_mask
+        if mask is None:
+            mask = self._build_trading_mask()
+        offset = check_date.toordinal() - self._first_ordinal
+        if offset < 0 or (offset >> 3) >= len(mask):
+            return False
+        return bool(mask[offset >> 3] & (1 << (offset & 7)))
+
+    def _build_trading_mask(self) -> bytes:
+        ordinals = [d.date.toordinal() for d in self.trading_days]
+        if not ordinals:
+            self._trading_mask = b""
+            return self._trading_mask
+        first = min(ordinals)
+        mask = bytearray((max(ordinals) - first) // 8 + 1)
+        for ordinal, day in zip(ordinals, self.trading_days):
+            if day.is_trading_day:
+                offset = ordinal - first
+                mask[offset >> 3] |= 1 << (offset & 7)
+        self._first_ordinal = first
+        self._trading_mask = bytes(mask)
+        return self._trading_mask
+
+    def next_trading_date(self, from_date: date) -> date | None:
+        """二分查找不早于 from_date 的首个交易日，本日历内没有则返回 None"""
+        if self._trading_dates is None:
+            self._trading_dates = [d.date for d in self.trading_days if d.is_trading_day]
+        idx = bisect_left(self._trading_dates, from_date)
+        if idx < len(self._trading_dates):
+            return self._trading_dates[idx]
+        return None
 
 
 class TradingCalendarSource(DataSource):
@@ -164,13 +243,30 @@ class TradingCalendarSource(DataSource):
         super().__init__("trading_calendar", DataSourceType.STOCK, timeout)
         self._cache_ttl = cache_ttl if cache_ttl is not None else self.CACHE_TTL
         self._cache: dict[str, tuple[datetime, CalendarResult]] = {}
+        self._disk_cache: DataCache | None = None
+
+    def _get_disk_cache(self) -> DataCache:
+        """获取磁盘缓存（首次使用时创建目录）"""
+        if self._disk_cache is None:
+            self._disk_cache = DataCache(CALENDAR_CACHE_DIR)
+        return self._disk_cache
 
     def _fetch_china_real_trading_days(self, year: int) -> set[date]:
-        """从东方财富获取A股真实交易日"""
+        """从东方财富获取A股真实交易日
+
+        结果依次缓存在进程内和磁盘上，磁盘缓存在 TTL 内跨进程复用，避免每次启动都请求接口。
+        """
         if year in self._china_real_trading_days:
             return self._china_real_trading_days[year]
 
-        trading_days: set[date] = set()
+        disk_key = f"china_trading_days_{year}"
+        cached_days = self._get_disk_cache().get(disk_key)
+        if cached_days:
+            trading_days = {date.fromisoformat(d) for d in cached_days}
+            self._china_real_trading_days[year] = trading_days
+            return trading_days
+
+        trading_days = set()
 
         try:
             url = (
@@ -192,6 +288,12 @@ class TradingCalendarSource(DataSource):
                         trading_days.add(d)
 
             self._china_real_trading_days[year] = trading_days
+            if trading_days:
+                self._get_disk_cache().set(
+                    disk_key,
+                    sorted(d.isoformat() for d in trading_days),
+                    ttl_seconds=self._cache_ttl,
+                )
 
         except httpx.HTTPError as e:
             logger.warning(f"获取A股真实交易日失败 (HTTP): {year}, error: {e}")
@@ -200,52 +302,58 @@ class TradingCalendarSource(DataSource):
 
         return trading_days
 
-    def _get_holidays(self, market: Market, year: int) -> set[date]:
-        country_code, _ = MARKET_COUNTRY_MAP.get(market, ("US", ["US"]))
-
+    def _get_holidays(self, market: Market, year: int) -> frozenset[date]:
         try:
-            holidays = country_holidays(country_code, years=year)
-            holiday_dates = set(holidays.keys())
-
-            if market == Market.CHINA:
-                hk_holidays = country_holidays("HK", years=year)
-                holiday_dates.update(hk_holidays.keys())
-
-            return holiday_dates
-        except Exception:
-            return set()
+            return _holidays_for(market.value, year)
+        except Exception as e:
+            logger.warning(f"获取节假日失败: {market.value} {year}, error: {e}")
+            return frozenset()
 
     def _is_weekend(self, day: date) -> bool:
-        return day.weekday() in (SATURDAY, SUNDAY)
+        # weekday(): 周一为 0，SATURDAY(5)/SUNDAY(6) 为周末
+        return day.weekday() >= SATURDAY
 
     def _get_special_dates(self, market: Market, year: int) -> dict[date, str]:
         if market == Market.CHINA:
             return {k: v for k, v in CHINA_SPECIAL_DATES.items() if k.year == year}
         return {}
 
+    def _get_cached_calendar(self, cache_key: str) -> CalendarResult | None:
+        """返回未过期的缓存日历"""
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            cached_time, cached_result = cached
+            if (datetime.now() - cached_time).total_seconds() < self._cache_ttl:
+                return cached_result
+        return None
+
     def _get_crypto_calendar(self, year: int) -> CalendarResult:
-        trading_days = []
-        for month in range(1, 13):
-            try:
-                for day in range(1, 32):
-                    d = date(year, month, day)
-                    trading_days.append(TradingDay(date=d, is_trading_day=True, holiday_name=None))
-            except ValueError:
-                continue
-        total_days = 366 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 365
-        return CalendarResult(
+        cache_key = f"crypto_{year}"
+        cached_result = self._get_cached_calendar(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        # 加密货币全年无休，按序数直接生成全年日期
+        first = date(year, 1, 1).toordinal()
+        last = date(year + 1, 1, 1).toordinal()
+        trading_days = [
+            TradingDay(date=date.fromordinal(o), is_trading_day=True, market="crypto")
+            for o in range(first, last)
+        ]
+        result = CalendarResult(
             market="crypto",
             year=year,
             trading_days=trading_days,
-            total_trading_days=total_days,
+            total_trading_days=len(trading_days),
             total_holidays=0,
         )
+        self._cache[cache_key] = (datetime.now(), result)
+        return result
 
     def is_within_trading_hours(
         self, market: Market | str, check_datetime: datetime | None = None
     ) -> dict:
-        if isinstance(market, str):
-            market = Market(market)
+        market = _to_market(market)
 
         if check_datetime is None:
             # 使用市场当地时区的当前时间
@@ -307,49 +415,33 @@ class TradingCalendarSource(DataSource):
                     "break_end": hours["break_end"].isoformat(),
                 }
 
-        if "day_open" in hours:
-            day_open = hours["day_open"]
-            day_close = hours["day_close"]
-            if day_open <= current_time < day_close:
-                return {
-                    "status": "open",
-                    "session": "day",
-                    "trading_start": day_open.isoformat(),
-                    "trading_end": day_close.isoformat(),
-                }
+        # 日盘（贵金属）与普通交易时段只在键名上不同，先取出时段边界再统一判断
+        is_day_session = "day_open" in hours
+        if is_day_session:
+            open_time, close_time = hours["day_open"], hours["day_close"]
         elif "open" in hours:
-            if hours["open"] <= current_time < hours["close"]:
-                return {
-                    "status": "open",
-                    "trading_start": hours["open"].isoformat(),
-                    "trading_end": hours["close"].isoformat(),
-                }
-
-        if "day_open" in hours:
-            if current_time < hours["day_open"]:
-                return {
-                    "status": "pre_market",
-                    "market_open": hours["day_open"].isoformat(),
-                }
-            return {
-                "status": "closed",
-                "reason": "After market hours",
-                "trading_end": hours["day_close"].isoformat(),
-            }
-        elif "open" in hours:
-            if current_time < hours["open"]:
-                return {
-                    "status": "pre_market",
-                    "market_open": hours["open"].isoformat(),
-                }
-
+            open_time, close_time = hours["open"], hours["close"]
+        else:
+            return {"status": "unknown", "reason": "No trading hours configured"}
+
+        if open_time <= current_time < close_time:
+            result = {"status": "open"}
+            if is_day_session:
+                result["session"] = "day"
+            result["trading_start"] = open_time.isoformat()
+            result["trading_end"] = close_time.isoformat()
+            return result
+
+        if current_time < open_time:
             return {
-                "status": "closed",
-                "reason": "After market hours",
-                "trading_end": hours["close"].isoformat(),
+                "status": "pre_market",
+                "market_open": open_time.isoformat(),
             }
-
-        return {"status": "unknown", "reason": "No trading hours configured"}
+        return {
+            "status": "closed",
+            "reason": "After market hours",
+            "trading_end": close_time.isoformat(),
+        }
 
     def get_calendar(
         self,
@@ -360,7 +452,7 @@ class TradingCalendarSource(DataSource):
     ) -> CalendarResult:
         if isinstance(market, str):
             try:
-                market = Market(market)
+                market = _to_market(market)
             except ValueError:
                 if market.lower() == "crypto":
                     return self._get_crypto_calendar(year or datetime.now().year)
@@ -375,13 +467,21 @@ class TradingCalendarSource(DataSource):
             end_date = date(year, 12, 31)
 
         cache_key = f"{market.value}_{year}"
-        if cache_key in self._cache:
-            cached_time, cached_result = self._cache[cache_key]
-            if (datetime.now() - cached_time).total_seconds() < self._cache_ttl:
-                return cached_result
+        cached_result = self._get_cached_calendar(cache_key)
+        if cached_result is not None:
+            return cached_result
 
         holidays = self._get_holidays(market, year)
         special_dates = self._get_special_dates(market, year)
+        # 补班日按年预先筛出，逐日判断只需一次集合成员检查
+        makeup_days = frozenset(d for d, name in special_dates.items() if "补班" in name)
+
+        # 节假日名称表按 (国家, 年份) 缓存，避免逐日重建
+        country_code, _ = MARKET_COUNTRY_MAP.get(market, ("US", ["US"]))
+        try:
+            holiday_names: HolidayBase | None = _country_holidays(country_code, year)
+        except Exception:
+            holiday_names = None
 
         # 判断是否为贵金属交易所
         is_precious_metal = market in (Market.SGE, Market.COMEX, Market.CME, Market.LBMA)
@@ -409,17 +509,13 @@ class TradingCalendarSource(DataSource):
                 else:
                     is_holiday = current in holidays
                     is_wknd = self._is_weekend(current)
-                    special_name = special_dates.get(current)
-
-                    is_makeup_day = special_name and "补班" in special_name  # type: ignore[assignment]
+                    is_makeup_day = current in makeup_days
                     is_trading = not is_holiday and not is_wknd
                     holiday_name = None
                     if is_holiday:
-                        try:
-                            country_code, _ = MARKET_COUNTRY_MAP.get(market, ("US", ["US"]))
-                            ch = country_holidays(country_code, years=year)
-                            holiday_name = ch.get(current)
-                        except Exception:
+                        if holiday_names is not None:
+                            holiday_name = holiday_names.get(current)
+                        else:
                             holiday_name = "Holiday"
 
             trading_days.append(
@@ -427,7 +523,7 @@ class TradingCalendarSource(DataSource):
                     date=current,
                     is_trading_day=is_trading,
                     holiday_name=holiday_name or special_dates.get(current),
-                    is_makeup_day=bool(is_makeup_day),
+                    is_makeup_day=is_makeup_day,
                     market=market.value,
                 )
             )
@@ -447,8 +543,6 @@ class TradingCalendarSource(DataSource):
         return result
 
     def _next_day(self, d: date) -> date:
-        from datetime import timedelta
-
         return d + timedelta(days=1)
 
     def _prev_day(self, d: date) -> date:
@@ -463,14 +557,10 @@ class TradingCalendarSource(DataSource):
                 check_date = get_market_date(market)
 
         if isinstance(market, str) and market.lower() != "crypto":
-            market = Market(market)
+            market = _to_market(market)
 
         result = self.get_calendar(market, year=check_date.year)
-        for day in result.trading_days:
-            if day.date == check_date:
-                return day.is_trading_day
-
-        return False
+        return result.is_trading_date(check_date)
 
     def get_next_trading_day(
         self,
@@ -480,16 +570,12 @@ class TradingCalendarSource(DataSource):
         if from_date is None:
             from_date = date.today()
 
-        for i in range(10):
-            check_date = from_date.replace(day=from_date.day + i)
-            if check_date.year != from_date.year:
-                result = self.get_calendar(market, year=check_date.year)
-            else:
-                result = self.get_calendar(market, year=from_date.year)
-
-            for day in result.trading_days:
-                if day.date >= from_date and day.is_trading_day:
-                    return day.date
+        # 当年剩余日期没有交易日时顺延到下一年
+        for year in (from_date.year, from_date.year + 1):
+            result = self.get_calendar(market, year=year)
+            next_date = result.next_trading_date(from_date)
+            if next_date is not None:
+                return next_date
 
         return from_date
 
@@ -498,13 +584,16 @@ class TradingCalendarSource(DataSource):
             markets = list(Market)
 
         status = {}
+        # 所有市场共用同一时刻，各市场只做一次时区换算
+        now_utc = datetime.now(timezone.utc)
 
         for market in markets:
-            today = get_market_date(market)
+            now_local = now_utc.astimezone(ZoneInfo(MARKET_TIMEZONES.get(market, "UTC")))
+            today = now_local.date()
             is_open = self.is_trading_day(market, today)
 
-            # Check if within trading session (uses current time)
-            session_info = self.is_within_trading_hours(market)
+            # 判断当前时刻是否处于交易时段
+            session_info = self.is_within_trading_hours(market, now_local)
             is_within_session = session_info.get("status") == "open"
 
             if not is_open:
@@ -4,14 +4,27 @@
 为 DataGateway 提供统一的数据结构定义
 """
 
+import itertools
+import os
 import time
-import uuid
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
 
 from src.datasources.base import DataSourceType
 
+# 请求 ID 计数器：与 PID 组合成跨进程唯一的 ID，无需系统熵调用
+_request_id_counter = itertools.count()
+
+
+def next_request_id() -> str:
+    """
+    生成请求 ID（PID 前缀 + 单调计数）
+
+    PID 在每次调用时读取，fork 出的子进程即使继承了计数器状态也不会与父进程重复。
+    """
+    return f"{os.getpid():x}-{next(_request_id_counter):x}"
+
 
 class RequestPriority(IntEnum):
     """请求优先级枚举"""
@@ -38,7 +51,7 @@ class DataRequest:
 
     symbol: str  # 股票代码/基金代码/商品名称
     source_type: DataSourceType  # 数据源类型
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = field(default_factory=next_request_id)
     priority: RequestPriority = RequestPriority.NORMAL
     allow_fallback: bool = True  # 是否允许降级
     timeout: float = 10.0  # 超时时间(秒)
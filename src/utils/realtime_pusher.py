@@ -49,6 +49,8 @@ class RealtimePusher:
         self._tasks: list[asyncio.Task] = []
 
         self._last_fund_data: list[dict] | None = None
+        # 上次推送基金数据时的订阅者，新订阅者需要补发一次完整数据
+        self._fund_subscribers: frozenset[str] = frozenset()
         self._last_commodity_data: list[dict] | None = None
         self._last_index_data: list[dict] | None = None
         self._last_sector_data: dict | None = None
@@ -215,8 +217,20 @@ class RealtimePusher:
                         },
                     )
 
-                if new_data:
-                    # 每次都推送完整数据（不使用差量更新）
+                # 与 sector loop 一致：diff 只决定是否推送，推送时发完整数据
+                # 有新订阅者时即使数据无变化也推送，保证其能拿到首份快照
+                subscribers = self.ws_manager.get_subscribers("funds")
+                has_new_subscriber = not subscribers <= self._fund_subscribers
+                unchanged = (
+                    not has_new_subscriber
+                    and bool(new_data)
+                    and self._last_fund_data is not None
+                    and self._diff_data("funds", self._last_fund_data, new_data) is None
+                )
+                if unchanged:
+                    logger.debug("基金推送: 数据无变化，跳过")
+                    self._fund_subscribers = subscribers
+                elif new_data:
                     camel_data = [_convert_dict_to_camel_case(item) for item in new_data]
                     sent = await self.ws_manager.broadcast_to_subscription(
                         subscription="funds",
@@ -232,6 +246,7 @@ class RealtimePusher:
                         },
                     )
                     self._last_fund_data = new_data
+                    self._fund_subscribers = subscribers
                 else:
                     logger.warning(
                         "基金推送全部失败",
@@ -493,6 +493,10 @@ class WebSocketManager:
         """获取指定订阅类型的订阅者数量"""
         return len(self._subscriptions.get(subscription, set()))
 
+    def get_subscribers(self, subscription: str) -> frozenset[str]:
+        """获取指定订阅类型的订阅者 ID 集合"""
+        return frozenset(self._subscriptions.get(subscription, ()))
+
     def get_clients_info(self) -> list[dict[str, Any]]:
         """获取所有客户端信息（返回 camelCase 格式）"""
         result = []
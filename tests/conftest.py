@@ -7,6 +7,7 @@
 - sample_holdings: 测试持仓列表
 - notification_config: 通知配置实例
 - client: FastAPI 测试客户端
+- fund_data_template: build_fund_response 输入数据公共字段
 """
 
 import os
@@ -135,6 +136,19 @@ def sample_commodities():
     ]
 
 
+@pytest.fixture(scope="session")
+def fund_data_template():
+    """返回基金数据公共字段（只读），用例通过 {**fund_data_template, ...} 覆盖差异字段"""
+    return {
+        "unit_net_value": 1.5,
+        "estimated_net_value": 1.52,
+        "estimated_growth_rate": 1.33,
+        "net_value_date": "2024-01-10",
+        "estimate_time": "2024-01-10 15:00",
+        "has_real_time_estimate": False,
+    }
+
+
 @pytest.fixture
 def temp_dir(tmp_path):
     """返回临时目录路径"""
@@ -17,14 +17,22 @@ from src.datasources.sector_source import (
 )
 
 
+@pytest.fixture(scope="module")
+def _eastmoney_sector_source():
+    """模块内只构造一次的东方财富板块数据源"""
+    return EastMoneySectorSource()
+
+
+@pytest.fixture
+def sector_source(_eastmoney_sector_source):
+    """东方财富板块数据源，每个用例前清空缓存，保证 fetch 走真实获取路径且不依赖用例顺序"""
+    _eastmoney_sector_source.clear_cache()
+    return _eastmoney_sector_source
+
+
 class TestEastMoneySectorSpotSource:
     """测试 akshare _spot_em 接口"""
 
-    @pytest.fixture
-    def sector_source(self):
-        """创建数据源实例"""
-        return EastMoneySectorSource()
-
     @pytest.mark.asyncio
     async def test_fetch_industry_spot(self, sector_source):
         """测试获取行业板块实时行情"""
@@ -210,6 +218,8 @@ class TestSinaSectorDataSource:
         assert result.source == "sina_sector"
         if result.success:
             assert isinstance(result.data, list)
+        else:
+            assert result.error is not None
 
     @pytest.mark.asyncio
     async def test_fetch_by_code(self, source):
@@ -219,6 +229,8 @@ class TestSinaSectorDataSource:
         assert result.source == "sina_sector"
         if result.success:
             assert isinstance(result.data, list)
+        else:
+            assert result.error is not None
 
     @pytest.mark.asyncio
     async def test_fetch_by_category(self, source):
@@ -228,6 +240,8 @@ class TestSinaSectorDataSource:
         assert result.source == "sina_sector"
         if result.success:
             assert isinstance(result.data, list)
+        else:
+            assert result.error is not None
 
 
 class TestSectorDataAggregator:
@@ -258,15 +272,10 @@ class TestSectorDataAggregator:
 class TestEastMoneySectorSource:
     """东方财富板块数据源测试"""
 
-    @pytest.fixture
-    def source(self):
-        """创建数据源实例"""
-        return EastMoneySectorSource()
-
     @pytest.mark.asyncio
-    async def test_fetch_industry(self, source):
+    async def test_fetch_industry(self, sector_source):
         """测试获取行业板块"""
-        result = await source.fetch("industry")
+        result = await sector_source.fetch("industry")
 
         assert result.source == "sector_eastmoney_akshare"
         # 接口已实现，应该能获取数据
@@ -279,9 +288,9 @@ class TestEastMoneySectorSource:
             assert result.error is not None
 
     @pytest.mark.asyncio
-    async def test_fetch_concept(self, source):
+    async def test_fetch_concept(self, sector_source):
         """测试获取概念板块"""
-        result = await source.fetch("concept")
+        result = await sector_source.fetch("concept")
 
         assert result.source == "sector_eastmoney_akshare"
         if result.success:
@@ -292,26 +301,26 @@ class TestEastMoneySectorSource:
             assert result.error is not None
 
     @pytest.mark.asyncio
-    async def test_fetch_invalid_type(self, source):
+    async def test_fetch_invalid_type(self, sector_source):
         """测试获取不支持的板块类型"""
-        result = await source.fetch("invalid_type")
+        result = await sector_source.fetch("invalid_type")
 
         assert result.success is False
         assert "不支持" in result.error
 
     @pytest.mark.asyncio
-    async def test_fetch_batch(self, source):
+    async def test_fetch_batch(self, sector_source):
         """测试批量获取"""
-        result = await source.fetch_batch(["industry", "concept"])
+        result = await sector_source.fetch_batch(["industry", "concept"])
 
         assert len(result) == 2
         # 至少行业板块应该成功
         assert result[0].source == "sector_eastmoney_akshare"
 
     @pytest.mark.asyncio
-    async def test_get_status(self, source):
+    async def test_get_status(self, sector_source):
         """测试状态获取"""
-        status = source.get_status()
+        status = sector_source.get_status()
 
         assert status["name"] == "sector_eastmoney_akshare"
         assert status["type"] == "sector"
@@ -319,16 +328,20 @@ class TestEastMoneySectorSource:
         assert "cache_size" in status
 
 
-class TestEastMoneyDetailSources:
-    """东方财富板块详情数据源测试"""
+@pytest.fixture(scope="module")
+def industry_source():
+    """模块内共享的行业板块详情数据源"""
+    return EastMoneyIndustryDetailSource()
 
-    @pytest.fixture
-    def industry_source(self):
-        return EastMoneyIndustryDetailSource()
 
-    @pytest.fixture
-    def concept_source(self):
-        return EastMoneyConceptDetailSource()
+@pytest.fixture(scope="module")
+def concept_source():
+    """模块内共享的概念板块详情数据源"""
+    return EastMoneyConceptDetailSource()
+
+
+class TestEastMoneyDetailSources:
+    """东方财富板块详情数据源测试"""
 
     @pytest.mark.asyncio
     async def test_industry_detail(self, industry_source):
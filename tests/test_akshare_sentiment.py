@@ -7,6 +7,7 @@ AKShare 舆情数据源测试
 3. AKShareSentimentAggregatorDataSource - 舆情聚合
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,6 +20,11 @@ from src.datasources.akshare_sentiment_source import (
 from src.datasources.base import DataSourceType
 
 
+def _make_df(records: list[dict]) -> SimpleNamespace:
+    """构造最小的 DataFrame 替身，只提供数据源用到的 empty / to_dict"""
+    return SimpleNamespace(empty=not records, to_dict=lambda orient="records": records)
+
+
 class TestAKShareEconomicNewsDataSource:
     """测试全球宏观事件数据源"""
 
@@ -42,20 +48,20 @@ class TestAKShareEconomicNewsDataSource:
         ds = AKShareEconomicNewsDataSource()
 
         # Mock akshare 调用
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [
-            {
-                "日期": "2024-01-01",
-                "时间": "10:00",
-                "地区": "美国",
-                "事件": "非农数据",
-                "公布": 3.5,
-                "预期": 3.0,
-                "前值": 2.8,
-                "重要性": 3,
-            }
-        ]
+        mock_df = _make_df(
+            [
+                {
+                    "日期": "2024-01-01",
+                    "时间": "10:00",
+                    "地区": "美国",
+                    "事件": "非农数据",
+                    "公布": 3.5,
+                    "预期": 3.0,
+                    "前值": 2.8,
+                    "重要性": 3,
+                }
+            ]
+        )
 
         with patch.object(ds, "_fetch_data", return_value=mock_df):
             result = await ds.fetch("20240101")
@@ -71,15 +77,11 @@ class TestAKShareEconomicNewsDataSource:
         """测试缓存命中"""
         ds = AKShareEconomicNewsDataSource()
 
-        # 预先填充缓存
-        cached_data = [{"日期": "2024-01-01", "事件": "测试事件"}]
-        ds._cache = cached_data
-        ds._cache_time = 1000.0
-
-        # 设置缓存时间戳为当前时间附近
         import time
 
-        ds._cache_time = time.time() - 60  # 1分钟前，在5分钟缓存期内
+        # 预先填充缓存，时间戳为1分钟前，在5分钟缓存期内
+        cached_data = [{"日期": "2024-01-01", "事件": "测试事件"}]
+        ds._cache["20240101"] = {"data": cached_data, "_cache_time": time.time() - 60}
 
         result = await ds.fetch("20240101")
 
@@ -103,8 +105,7 @@ class TestAKShareEconomicNewsDataSource:
         """测试空DataFrame返回"""
         ds = AKShareEconomicNewsDataSource()
 
-        mock_df = MagicMock()
-        mock_df.empty = True
+        mock_df = _make_df([])
 
         with patch.object(ds, "_fetch_data", return_value=mock_df):
             result = await ds.fetch("20240101")
@@ -117,9 +118,7 @@ class TestAKShareEconomicNewsDataSource:
         """测试批量获取"""
         ds = AKShareEconomicNewsDataSource()
 
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{"日期": "2024-01-01", "事件": "测试"}]
+        mock_df = _make_df([{"日期": "2024-01-01", "事件": "测试"}])
 
         with patch.object(ds, "_fetch_data", return_value=mock_df):
             results = await ds.fetch_batch(["20240101", "20240102"])
@@ -127,36 +126,73 @@ class TestAKShareEconomicNewsDataSource:
             assert len(results) == 2
             assert all(r.success for r in results)
 
+    @pytest.mark.asyncio
+    async def test_fetch_caches_each_date_separately(self):
+        """测试不同日期的数据互不串用"""
+        ds = AKShareEconomicNewsDataSource()
+
+        with patch.object(
+            ds, "_fetch_data", side_effect=lambda d: _make_df([{"日期": d, "事件": "测试"}])
+        ):
+            await ds.fetch("20240101")
+            result = await ds.fetch("20240102")
+
+        assert result.metadata.get("from_cache") is None
+        assert result.data == [{"日期": "20240102", "事件": "测试"}]
+        assert ds._cached_result("20240101").data == [{"日期": "20240101", "事件": "测试"}]
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_flight(self):
+        """测试并发缓存未命中只回源一次"""
+        import asyncio
+        import time
+
+        ds = AKShareEconomicNewsDataSource()
+        mock_df = _make_df([{"日期": "2024-01-01", "事件": "测试"}])
+        call_count = 0
+
+        def slow_fetch(date):
+            nonlocal call_count
+            call_count += 1
+            time.sleep(0.05)
+            return mock_df
+
+        with patch.object(ds, "_fetch_data", side_effect=slow_fetch):
+            results = await asyncio.gather(*[ds.fetch("20240101") for _ in range(5)])
+
+        assert call_count == 1
+        assert all(r.success for r in results)
+        assert sum(1 for r in results if r.metadata.get("from_cache")) == 4
+
     def test_is_cache_valid(self):
         """测试缓存有效性检查"""
+        import time
+
         ds = AKShareEconomicNewsDataSource()
-        cache_key = "test_key"
+        cache_key = "20240101"
 
         # 空缓存
         assert ds._is_cache_valid(cache_key) is False
 
         # 有缓存但超时
-        ds._cache = [{}]
-        ds._cache_time = 0
+        ds._cache[cache_key] = {"data": [{}], "_cache_time": 0}
         assert ds._is_cache_valid(cache_key) is False
 
         # 有效缓存
-        import time
-
-        ds._cache_time = time.time() - 60  # 1分钟前
+        ds._cache[cache_key]["_cache_time"] = time.time() - 60  # 1分钟前
         assert ds._is_cache_valid(cache_key) is True
+        # 其他日期不受影响
+        assert ds._is_cache_valid("20240102") is False
 
     def test_clear_cache(self):
         """测试清空缓存"""
         ds = AKShareEconomicNewsDataSource()
 
-        ds._cache = [{"test": "data"}]
-        ds._cache_time = 1000.0
+        ds._cache["20240101"] = {"data": [{"test": "data"}], "_cache_time": 1000.0}
 
         ds.clear_cache()
 
-        assert ds._cache == []
-        assert ds._cache_time == 0.0
+        assert ds._cache == {}
 
 
 class TestAKShareWeiboSentimentDataSource:
@@ -193,12 +229,12 @@ class TestAKShareWeiboSentimentDataSource:
         """测试获取2小时周期数据"""
         ds = AKShareWeiboSentimentDataSource()
 
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [
-            {"name": "股票A", "rate": 85.5},
-            {"name": "股票B", "rate": 72.3},
-        ]
+        mock_df = _make_df(
+            [
+                {"name": "股票A", "rate": 85.5},
+                {"name": "股票B", "rate": 72.3},
+            ]
+        )
 
         with patch.object(ds, "_fetch_data", return_value=mock_df):
             result = await ds.fetch("2h")
@@ -212,9 +248,7 @@ class TestAKShareWeiboSentimentDataSource:
         """测试无效周期参数，使用默认"""
         ds = AKShareWeiboSentimentDataSource()
 
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{"name": "test", "rate": 50.0}]
+        mock_df = _make_df([{"name": "test", "rate": 50.0}])
 
         with patch.object(ds, "_fetch_data", return_value=mock_df) as mock_fetch:
             await ds.fetch("invalid_period")
@@ -230,8 +264,7 @@ class TestAKShareWeiboSentimentDataSource:
         import time
 
         cached_data = [{"name": "test", "rate": 50.0}]
-        ds._cache = cached_data
-        ds._cache_time = time.time() - 60  # 1分钟前
+        ds._cache["12h"] = {"data": cached_data, "_cache_time": time.time() - 60}  # 1分钟前
 
         result = await ds.fetch("12h")
 
@@ -239,14 +272,43 @@ class TestAKShareWeiboSentimentDataSource:
         assert result.data == cached_data
         assert result.metadata.get("from_cache") is True
 
+    def test_is_cache_valid_per_period(self):
+        """测试按周期的缓存有效期"""
+        import time
+
+        ds = AKShareWeiboSentimentDataSource()
+        two_minutes_ago = time.time() - 120
+        ds._cache["2h"] = {"data": [{"name": "test"}], "_cache_time": two_minutes_ago}
+        ds._cache["30d"] = {"data": [{"name": "test"}], "_cache_time": two_minutes_ago}
+
+        assert ds._is_cache_valid("2h") is False
+        assert ds._is_cache_valid("30d") is True
+        # 其他周期的缓存不会让未缓存的周期命中
+        assert ds._is_cache_valid("7d") is False
+        # 未配置的周期回退到默认有效期
+        assert ds._get_cache_timeout("unknown") == ds._cache_timeout
+
+    @pytest.mark.asyncio
+    async def test_fetch_caches_each_period_separately(self):
+        """测试不同周期的数据互不串用"""
+        ds = AKShareWeiboSentimentDataSource()
+
+        with patch.object(
+            ds, "_fetch_data", side_effect=lambda p: _make_df([{"name": p, "rate": 1.0}])
+        ):
+            await ds.fetch("2h")
+            result = await ds.fetch("30d")
+
+        assert result.metadata.get("from_cache") is None
+        assert result.data == [{"name": "CNDAY30", "rate": 1.0}]
+        assert ds._cached_result("2h").data == [{"name": "CNHOUR2", "rate": 1.0}]
+
     @pytest.mark.asyncio
     async def test_fetch_batch(self):
         """测试批量获取"""
         ds = AKShareWeiboSentimentDataSource()
 
-        mock_df = MagicMock()
-        mock_df.empty = False
-        mock_df.to_dict.return_value = [{"name": "test", "rate": 50.0}]
+        mock_df = _make_df([{"name": "test", "rate": 50.0}])
 
         with patch.object(ds, "_fetch_data", return_value=mock_df):
             results = await ds.fetch_batch(["2h", "6h", "12h"])
@@ -257,13 +319,11 @@ class TestAKShareWeiboSentimentDataSource:
         """测试清空缓存"""
         ds = AKShareWeiboSentimentDataSource()
 
-        ds._cache = [{"name": "test"}]
-        ds._cache_time = 1000.0
+        ds._cache["12h"] = {"data": [{"name": "test"}], "_cache_time": 1000.0}
 
         ds.clear_cache()
 
-        assert ds._cache == []
-        assert ds._cache_time == 0.0
+        assert ds._cache == {}
 
 
 class TestAKShareSentimentAggregatorDataSource:
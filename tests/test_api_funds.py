@@ -3,6 +3,7 @@ funds.py API 路由测试
 测试基金 API 端点的功能
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from api.dependencies_impl import set_data_source_manager
 from api.main import app
+from api.routes.funds import _calculate_estimate_change, _is_qdii_fund
 from src.datasources.base import DataSourceResult
 
 
@@ -41,11 +43,12 @@ class TestSearchFunds:
         """测试搜索基金"""
         with patch("src.db.fund.FundBasicInfoDAO") as mock_dao_class:
             mock_dao = MagicMock()
-            mock_fund = MagicMock()
-            mock_fund.code = "000001"
-            mock_fund.short_name = "测试基金"
-            mock_fund.name = "测试基金有限公司"
-            mock_fund.type = "混合型"
+            mock_fund = SimpleNamespace(
+                code="000001",
+                short_name="测试基金",
+                name="测试基金有限公司",
+                type="混合型",
+            )
             mock_dao.search.return_value = [mock_fund]
             mock_dao_class.return_value = mock_dao
 
@@ -173,8 +176,6 @@ class TestHelperFunctions:
 
     def test_calculate_estimate_change(self):
         """测试计算估算涨跌额"""
-        from api.routes.funds import _calculate_estimate_change
-
         # 正常情况
         result = _calculate_estimate_change(1.5000, 1.5234)
         assert result == 0.0234
@@ -189,8 +190,6 @@ class TestHelperFunctions:
 
     def test_is_qdii_fund(self):
         """测试 QDII 基金判断"""
-        from api.routes.funds import _is_qdii_fund
-
         with patch("api.routes.funds.get_basic_info_db") as mock_get_info:
             # QDII 基金
             mock_get_info.return_value = {"type": "QDII", "name": "测试QDII基金"}
@@ -110,6 +110,18 @@ class TestDataCache:
         assert len(result["funds"]) == 2
         assert result["metadata"]["source"] == "akshare"
 
+    def test_cache_file_compact_roundtrip(self, cache):
+        """测试缓存文件紧凑写入且保留中文"""
+        news = [{"title": "中文标题", "url": "https://finance.sina.com.cn/"}] * 100
+
+        cache.set("news", news, ttl_seconds=300)
+        content = cache._get_cache_path("news").read_text(encoding="utf-8")
+
+        assert "中文标题" in content
+        assert "\n" not in content
+        assert ", " not in content
+        assert cache.get("news") == news
+
     def test_cache_default_ttl(self, cache):
         """测试默认 TTL（5分钟）"""
         cache.set("default_ttl", "value")
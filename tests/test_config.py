@@ -136,6 +136,15 @@ class TestPriceAlert:
         # 低于目标价，触发
         assert alert.check(1.4)
 
+    def test_price_alert_slots(self):
+        """测试模型使用 __slots__，不分配实例 __dict__"""
+        alert = PriceAlert(fund_code="000001", fund_name="测试基金", target_price=1.5)
+        holding = Holding(code="000001", name="测试基金", shares=100.0, cost=1.0)
+
+        assert not hasattr(alert, "__dict__")
+        assert not hasattr(holding, "__dict__")
+        assert holding.total_cost == 100.0
+
 
 class TestNotificationConfig:
     """通知配置测试"""
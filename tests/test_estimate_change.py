@@ -5,74 +5,46 @@
 
 import pytest
 
-from api.routes.funds.funds_data import _calculate_estimate_change
+from api.routes.funds.funds_data import (
+    _calculate_estimate_change,
+    _validate_estimate_change_percent,
+)
 
 
 class TestCalculateEstimateChange:
     """测试 _calculate_estimate_change 函数"""
 
-    def test_normal_case(self):
-        """正常情况：估算净值 > 单位净值，返回正数"""
-        unit_net = 1.2233
-        estimate_net = 1.2304
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        assert result == pytest.approx(0.0071, rel=1e-4)
-
-    def test_negative_change(self):
-        """估算净值 < 单位净值，返回负数"""
-        unit_net = 1.2306
-        estimate_net = 1.2200
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        assert result == pytest.approx(-0.0106, rel=1e-4)
-
-    def test_no_change(self):
-        """估算净值 == 单位净值，返回 0"""
-        unit_net = 1.5000
-        estimate_net = 1.5000
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        assert result == 0.0
-
-    def test_unit_net_none(self):
-        """单位净值为 None，返回 None"""
-        result = _calculate_estimate_change(None, 1.5000)
-        assert result is None
-
-    def test_estimate_net_none(self):
-        """估算净值为 None，返回 None"""
-        result = _calculate_estimate_change(1.5000, None)
-        assert result is None
-
-    def test_both_none(self):
-        """两个都为 None，返回 None"""
-        result = _calculate_estimate_change(None, None)
-        assert result is None
-
-    def test_unit_net_zero(self):
-        """单位净值为 0，减法运算仍然有效"""
-        result = _calculate_estimate_change(0, 1.5000)
-        assert result == 1.5000
-
-    def test_small_change(self):
-        """小幅度变化"""
-        unit_net = 1.0000
-        estimate_net = 1.0001
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        assert result == pytest.approx(0.0001, rel=1e-4)
-
-    def test_large_change(self):
-        """大幅度变化（涨跌停）"""
-        unit_net = 1.0000
-        estimate_net = 1.1000  # 10% 涨幅
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        assert result == pytest.approx(0.1000, rel=1e-4)
-
-    def test_rounding(self):
-        """测试四舍五入到 4 位小数"""
-        unit_net = 1.12345678
-        estimate_net = 1.12345679
-        result = _calculate_estimate_change(unit_net, estimate_net)
-        # 差值约为 0.00000001，应被 round 到 0.0000
-        assert result == 0.0
+    @pytest.mark.parametrize(
+        "unit_net, estimate_net, expected",
+        [
+            # 正常情况：估算净值 > 单位净值，返回正数
+            (1.2233, 1.2304, 0.0071),
+            # 估算净值 < 单位净值，返回负数
+            (1.2306, 1.2200, -0.0106),
+            # 估算净值 == 单位净值，返回 0
+            (1.5000, 1.5000, 0.0),
+            # 任一为 None，返回 None
+            (None, 1.5000, None),
+            (1.5000, None, None),
+            (None, None, None),
+            # 单位净值为 0，减法运算仍然有效
+            (0, 1.5000, 1.5000),
+            # 小幅度变化
+            (1.0000, 1.0001, 0.0001),
+            # 大幅度变化（涨跌停，10% 涨幅）
+            (1.0000, 1.1000, 0.1000),
+            # 差值约为 0.00000001，应被 round 到 0.0000
+            (1.12345678, 1.12345679, 0.0),
+            # 差值保留 4 位小数
+            (1.123456, 1.654321, 0.5309),
+            # 极端值：大数与极小数值
+            (1000000.0, 1000000.1234, 0.1234),
+            (0.0001, 0.0002, 0.0001),
+        ],
+    )
+    def test_calculate_estimate_change(self, unit_net, estimate_net, expected):
+        """结果为 round(estimate_net - unit_net, 4)，任一输入为 None 时返回 None"""
+        assert _calculate_estimate_change(unit_net, estimate_net) == expected
 
 
 class TestEstimateChangePercentConsistency:
@@ -101,8 +73,6 @@ class TestValidateEstimateChangePercent:
 
     def test_valid_percent_returns_unchanged(self):
         """提供的增长率与计算值一致，返回原值"""
-        from api.routes.funds.funds_data import _validate_estimate_change_percent
-
         unit_net = 1.2233
         estimate_net = 1.2304
         provided_percent = 0.5838  # 接近计算值
@@ -114,8 +84,6 @@ class TestValidateEstimateChangePercent:
 
     def test_invalid_percent_is_corrected(self):
         """提供的增长率与计算值不一致，返回修正值"""
-        from api.routes.funds.funds_data import _validate_estimate_change_percent
-
         unit_net = 1.2233
         estimate_net = 1.2304
         provided_percent = 99.0  # 错误值
@@ -129,15 +97,11 @@ class TestValidateEstimateChangePercent:
 
     def test_none_values_return_provided(self):
         """当输入为 None 时，返回提供的值（不做校验）"""
-        from api.routes.funds.funds_data import _validate_estimate_change_percent
-
         assert _validate_estimate_change_percent(None, 1.5, 5.0, "023521") == 5.0
         assert _validate_estimate_change_percent(1.5, None, 5.0, "023521") == 5.0
         assert _validate_estimate_change_percent(1.5, 1.5, None, "023521") is None
 
     def test_zero_unit_net_returns_provided(self):
         """当 unit_net 为 0 时，避免除零错误"""
-        from api.routes.funds.funds_data import _validate_estimate_change_percent
-
         result = _validate_estimate_change_percent(0, 1.5, 5.0, "023521")
         assert result == 5.0
@@ -13,11 +13,50 @@
 """
 
 import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.datasources.base import DataSourceResult, DataSourceType
+from src.datasources.dual_cache import DualLayerCache
+from src.datasources.fund.fund123_client import Fund123Client
+from src.datasources.fund.fund_concept_service import TOP_TAGS_N, _extract_name_concepts
+from src.datasources.fund_source import (
+    EastMoneyFundDataSource,
+    Fund123DataSource,
+    FundHistorySource,
+    FundHistoryYFinanceSource,
+    SinaFundDataSource,
+    TiantianFundDataSource,
+    _get_latest_trading_day,
+    _has_real_time_estimate,
+    _infer_fund_type_from_name,
+    _is_after_market_close,
+    _is_net_value_cache_valid,
+    get_fund_cache,
+    get_fund_cache_stats,
+)
+
+# 天天基金估值接口的 JSONP 样例响应（富国中证新能源汽车指数）
+_TIANTIAN_SAMPLE_RESPONSE = (
+    'jsonpgz({"fundcode":"161039","name":"富国中证新能源汽车指数","jzrq":"2024-01-10",'
+    '"dwjz":"2.0000","gsz":"2.0500","gszzl":"2.50","gztime":"2024-01-10 15:00"});'
+)
+
+
+class _StubResponse:
+    """轻量 HTTP 响应替身，只提供数据源读取的 text 与 raise_for_status"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
 
 # ============================================================================
 # 辅助函数测试
@@ -29,19 +68,13 @@ class TestGetFundCache:
 
     def test_get_fund_cache_returns_dual_layer_cache(self):
         """测试返回 DualLayerCache 实例"""
-        from src.datasources.fund_source import get_fund_cache
-
         cache = get_fund_cache()
         assert cache is not None
         # 验证是 DualLayerCache 实例
-        from src.datasources.dual_cache import DualLayerCache
-
         assert isinstance(cache, DualLayerCache)
 
     def test_get_fund_cache_singleton(self):
         """测试单例模式"""
-        from src.datasources.fund_source import get_fund_cache
-
         cache1 = get_fund_cache()
         cache2 = get_fund_cache()
         assert cache1 is cache2
@@ -52,8 +85,6 @@ class TestSafeFloat:
 
     def test_safe_float_with_valid_number(self):
         """测试有效数字转换"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._safe_float("1.23") == 1.23
         assert source._safe_float(1.23) == 1.23
@@ -61,23 +92,17 @@ class TestSafeFloat:
 
     def test_safe_float_with_none(self):
         """测试 None 值"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._safe_float(None) is None
 
     def test_safe_float_with_invalid_string(self):
         """测试无效字符串"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._safe_float("abc") is None
         assert source._safe_float("") is None
 
     def test_safe_float_with_special_values(self):
         """测试特殊值"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._safe_float("0") == 0.0
         assert source._safe_float(0) == 0.0
@@ -89,8 +114,6 @@ class TestValidateFundCode:
 
     def test_valid_fund_code_6_digits(self):
         """测试有效的6位基金代码"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._validate_fund_code("161039") is True
         assert source._validate_fund_code("000001") is True
@@ -98,8 +121,6 @@ class TestValidateFundCode:
 
     def test_invalid_fund_code_wrong_length(self):
         """测试长度错误的基金代码"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._validate_fund_code("12345") is False
         assert source._validate_fund_code("1234567") is False
@@ -107,8 +128,6 @@ class TestValidateFundCode:
 
     def test_invalid_fund_code_non_digits(self):
         """测试包含非数字的基金代码"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source._validate_fund_code("abc123") is False
         assert source._validate_fund_code("16103a") is False
@@ -117,84 +136,68 @@ class TestValidateFundCode:
 class TestInferFundTypeFromName:
     """测试 _infer_fund_type_from_name 函数"""
 
-    def test_infer_qdii(self):
-        """测试 QDII 类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("华夏全球精选股票(QDII)") == "QDII"
-        assert _infer_fund_type_from_name("广发纳斯达克100指数(QDII)") == "QDII"
-        assert _infer_fund_type_from_name("某QDII基金") == "QDII"
-
-    def test_infer_fof(self):
-        """测试 FOF 类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("华夏聚惠稳健目标风险混合(FOF)") == "FOF"
-        assert _infer_fund_type_from_name("南方养老2035FOF") == "FOF"
-
-    def test_infer_etf(self):
-        """测试 ETF 类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("华夏沪深300ETF") == "ETF"
-        assert _infer_fund_type_from_name("易方达创业板ETF") == "ETF"
-
-    def test_infer_etf_connect(self):
-        """测试 ETF 联接基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("华夏沪深300ETF联接") == "ETF-联接"
-        assert _infer_fund_type_from_name("易方达创业板ETF联接A") == "ETF-联接"
-
-    def test_infer_lof(self):
-        """测试 LOF 类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("兴全合润混合(LOF)") == "LOF"
-        assert _infer_fund_type_from_name("中欧盛世成长混合(LOF)") == "LOF"
-
-    def test_infer_money(self):
-        """测试货币型基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("余额宝货币市场基金") == "货币型"
-        assert _infer_fund_type_from_name("华夏货币A") == "货币型"
-
-    def test_infer_bond(self):
-        """测试债券型基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("易方达稳健债券") == "债券型"
-        assert _infer_fund_type_from_name("华夏债券A") == "债券型"
-
-    def test_infer_hybrid(self):
-        """测试混合型基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("华夏回报混合") == "混合型"
-        assert _infer_fund_type_from_name("易方达蓝筹精选混合") == "混合型"
-
-    def test_infer_index(self):
-        """测试指数型基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("招商中证白酒指数") == "指数型"
-        assert _infer_fund_type_from_name("易方达上证50指数A") == "指数型"
-
-    def test_infer_stock(self):
-        """测试股票型基金类型推断"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("易方达中小盘股票") == "股票型"
-        assert _infer_fund_type_from_name("华夏成长股票") == "股票型"
-
-    def test_infer_empty_or_unknown(self):
-        """测试空名称或未知类型"""
-        from src.datasources.fund_source import _infer_fund_type_from_name
-
-        assert _infer_fund_type_from_name("") == ""
-        assert _infer_fund_type_from_name(None) == ""  # type: ignore
-        assert _infer_fund_type_from_name("某基金") == ""
+    @pytest.mark.parametrize(
+        "fund_name, expected",
+        [
+            # QDII
+            ("华夏全球精选股票(QDII)", "QDII"),
+            ("广发纳斯达克100指数(QDII)", "QDII"),
+            ("某QDII基金", "QDII"),
+            # FOF
+            ("华夏聚惠稳健目标风险混合(FOF)", "FOF"),
+            ("南方养老2035FOF", "FOF"),
+            # ETF
+            ("华夏沪深300ETF", "ETF"),
+            ("易方达创业板ETF", "ETF"),
+            # ETF 联接
+            ("华夏沪深300ETF联接", "ETF-联接"),
+            ("易方达创业板ETF联接A", "ETF-联接"),
+            # LOF
+            ("兴全合润混合(LOF)", "LOF"),
+            ("中欧盛世成长混合(LOF)", "LOF"),
+            # 货币型
+            ("余额宝货币市场基金", "货币型"),
+            ("华夏货币A", "货币型"),
+            # 债券型
+            ("易方达稳健债券", "债券型"),
+            ("华夏债券A", "债券型"),
+            # 混合型
+            ("华夏回报混合", "混合型"),
+            ("易方达蓝筹精选混合", "混合型"),
+            # 指数型
+            ("招商中证白酒指数", "指数型"),
+            ("易方达上证50指数A", "指数型"),
+            # 股票型
+            ("易方达中小盘股票", "股票型"),
+            ("华夏成长股票", "股票型"),
+            # 空名称或未知类型
+            ("", ""),
+            (None, ""),
+            ("某基金", ""),
+        ],
+    )
+    def test_infer_fund_type(self, fund_name, expected):
+        """测试从名称推断基金类型"""
+        assert _infer_fund_type_from_name(fund_name) == expected
+
+
+class TestExtractNameConcepts:
+    """测试 _extract_name_concepts 函数"""
+
+    def test_extract_in_keyword_order(self):
+        """测试按关键词表顺序提取标签"""
+        assert _extract_name_concepts("华夏人工智能ETF联接") == ["人工智能", "智能"]
+        assert _extract_name_concepts("招商绿电新能源") == ["新能源", "能源", "绿色电力"]
+
+    def test_extract_limit(self):
+        """测试标签数量上限"""
+        name = "人工智能芯片半导体机器人新能源光伏白酒"
+        assert len(_extract_name_concepts(name)) == TOP_TAGS_N
+
+    def test_extract_no_match(self):
+        """测试无关键词匹配"""
+        assert _extract_name_concepts("") == []
+        assert _extract_name_concepts("华夏回报混合") == []
 
 
 class TestHasRealTimeEstimate:
@@ -202,16 +205,12 @@ class TestHasRealTimeEstimate:
 
     def test_qdii_no_real_time(self):
         """QDII 基金无实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("QDII", "华夏全球精选") is False
         assert _has_real_time_estimate("QDII-股票", "某QDII股票基金") is False
         assert _has_real_time_estimate("QDII-商品", "某QDII商品基金") is False
 
     def test_normal_fund_has_real_time(self):
         """普通基金有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("股票型", "富国中证新能源汽车指数") is True
         assert _has_real_time_estimate("混合型", "某混合基金") is True
         assert _has_real_time_estimate("债券型", "某债券基金") is True
@@ -219,23 +218,17 @@ class TestHasRealTimeEstimate:
 
     def test_fof_domestic_has_real_time(self):
         """国内 FOF 有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("FOF", "交银施罗德安享稳健养老FOF") is True
         assert _has_real_time_estimate("FOF", "中银添利稳健养老目标一年(FOF)") is True
 
     def test_fof_overseas_no_real_time(self):
         """投资海外的 FOF 无实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("FOF", "某海外投资FOF") is False
         assert _has_real_time_estimate("FOF", "某全球配置FOF") is False
         assert _has_real_time_estimate("FOF", "某QDII-FOF基金") is False
 
     def test_empty_type_returns_true(self):
         """空类型时从名称推断，仍无法判断则返回 True（保守）"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # 类型为空但名称可以推断时，返回推断结果
         assert _has_real_time_estimate("", "华夏全球精选股票(QDII)") is False
         assert _has_real_time_estimate(None, "某QDII基金") is False  # type: ignore
@@ -245,8 +238,6 @@ class TestHasRealTimeEstimate:
 
     def test_etf_link_has_real_time(self):
         """ETF-联接基金有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("ETF-联接", "华夏上证50ETF联接") is True
 
 
@@ -260,8 +251,6 @@ class TestTiantianFundDataSourceInit:
 
     def test_init_default_params(self):
         """测试默认参数初始化"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         assert source.name == "fund_tiantian"
         assert source.source_type == DataSourceType.FUND
@@ -271,8 +260,6 @@ class TestTiantianFundDataSourceInit:
 
     def test_init_custom_params(self):
         """测试自定义参数初始化"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource(timeout=60.0, max_retries=3, retry_delay=2.0)
         assert source.timeout == 60.0
         assert source.max_retries == 3
@@ -284,10 +271,8 @@ class TestTiantianFundDataSourceParseResponse:
 
     def test_parse_valid_response(self):
         """测试解析有效响应"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
-        response_text = 'jsonpgz({"fundcode":"161039","name":"富国中证新能源汽车指数","jzrq":"2024-01-10","dwjz":"2.0000","gsz":"2.0500","gszzl":"2.50","gztime":"2024-01-10 15:00"});'
+        response_text = _TIANTIAN_SAMPLE_RESPONSE
 
         result = source._parse_response(response_text, "161039")
 
@@ -302,8 +287,6 @@ class TestTiantianFundDataSourceParseResponse:
 
     def test_parse_response_with_extra_spaces(self):
         """测试带额外空格的响应"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         response_text = 'jsonpgz(  {"fundcode":"161039","name":"测试基金"}  );'
 
@@ -315,8 +298,6 @@ class TestTiantianFundDataSourceParseResponse:
 
     def test_parse_response_empty_gztime(self):
         """测试 gztime 为空的情况"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         response_text = 'jsonpgz({"fundcode":"161039","name":"测试基金","jzrq":"2024-01-10","dwjz":"2.0","gsz":"","gszzl":"","gztime":""});'
 
@@ -333,8 +314,6 @@ class TestTiantianFundDataSourceFetch:
     @pytest.mark.asyncio
     async def test_fetch_invalid_fund_code(self):
         """测试无效基金代码"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         result = await source.fetch("invalid")
 
@@ -344,10 +323,6 @@ class TestTiantianFundDataSourceFetch:
     @pytest.mark.asyncio
     async def test_fetch_with_cache_hit(self):
         """测试缓存命中场景"""
-        from datetime import date
-
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
         # Mock 数据库缓存（使用今天的日期，确保缓存被认为是新鲜的）
@@ -358,12 +333,13 @@ class TestTiantianFundDataSourceFetch:
         ):
             mock_dao = MagicMock()
             mock_dao.is_expired.return_value = False
-            mock_record = MagicMock()
-            mock_record.date = today  # 使用今天的日期
-            mock_record.unit_net_value = 2.0
-            mock_record.estimated_value = 2.05
-            mock_record.change_rate = 2.5
-            mock_record.estimate_time = f"{today} 15:00"
+            mock_record = SimpleNamespace(
+                date=today,  # 使用今天的日期
+                unit_net_value=2.0,
+                estimated_value=2.05,
+                change_rate=2.5,
+                estimate_time=f"{today} 15:00",
+            )
             mock_dao.get_latest.return_value = mock_record
             mock_dao_class.return_value = mock_dao
 
@@ -382,8 +358,6 @@ class TestTiantianFundDataSourceFetch:
     @pytest.mark.asyncio
     async def test_fetch_api_success(self):
         """测试 API 成功获取"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
         # Mock 所有外部依赖
@@ -411,9 +385,7 @@ class TestTiantianFundDataSourceFetch:
             mock_cache_class.return_value = mock_cache
 
             # Mock HTTP 响应
-            mock_response = MagicMock()
-            mock_response.text = 'jsonpgz({"fundcode":"161039","name":"富国中证新能源汽车指数","jzrq":"2024-01-10","dwjz":"2.0000","gsz":"2.0500","gszzl":"2.50","gztime":"2024-01-10 15:00"});'
-            mock_response.raise_for_status = MagicMock()
+            mock_response = _StubResponse(_TIANTIAN_SAMPLE_RESPONSE)
 
             with patch.object(
                 source.client, "get", new_callable=AsyncMock, return_value=mock_response
@@ -431,8 +403,6 @@ class TestTiantianFundDataSourceFetchBatch:
     @pytest.mark.asyncio
     async def test_fetch_batch_success(self):
         """测试批量获取成功"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
         # Mock fetch 方法
@@ -449,8 +419,6 @@ class TestTiantianFundDataSourceFetchBatch:
     @pytest.mark.asyncio
     async def test_fetch_batch_with_exception(self):
         """测试批量获取时某项抛出异常"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
         # Mock fetch 方法，第一个成功，第二个抛异常
@@ -479,13 +447,9 @@ class TestTiantianFundDataSourceHealthCheck:
     @pytest.mark.asyncio
     async def test_health_check_success(self):
         """测试健康检查成功"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
-        mock_response = MagicMock()
-        mock_response.text = 'jsonpgz({"fundcode":"161039","name":"测试基金"});'
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _StubResponse('jsonpgz({"fundcode":"161039","name":"测试基金"});')
 
         with patch.object(source.client, "get", new_callable=AsyncMock, return_value=mock_response):
             result = await source.health_check()
@@ -494,8 +458,6 @@ class TestTiantianFundDataSourceHealthCheck:
     @pytest.mark.asyncio
     async def test_health_check_failure(self):
         """测试健康检查失败"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
 
         with patch.object(
@@ -515,8 +477,6 @@ class TestFundHistorySource:
 
     def test_init(self):
         """测试初始化"""
-        from src.datasources.fund_source import FundHistorySource
-
         source = FundHistorySource()
         assert source.name == "fund_history_akshare"
         assert source.source_type == DataSourceType.FUND
@@ -524,8 +484,6 @@ class TestFundHistorySource:
     @pytest.mark.asyncio
     async def test_fetch_invalid_code(self):
         """测试无效基金代码"""
-        from src.datasources.fund_source import FundHistorySource
-
         source = FundHistorySource()
         result = await source.fetch("invalid")
 
@@ -535,8 +493,6 @@ class TestFundHistorySource:
     @pytest.mark.asyncio
     async def test_fetch_batch_empty(self):
         """测试批量获取空参数"""
-        from src.datasources.fund_source import FundHistorySource
-
         source = FundHistorySource()
         results = await source.fetch_batch()
 
@@ -544,6 +500,20 @@ class TestFundHistorySource:
         assert results[0].success is False
         assert "缺少 fund_code 参数" in results[0].error
 
+    def test_filter_by_period(self):
+        """测试按时间周期过滤"""
+        source = FundHistorySource()
+        today = datetime.now()
+        data = [
+            {"time": (today - timedelta(days=d)).strftime("%Y-%m-%d")} for d in (1, 20, 60, 400)
+        ]
+
+        assert source.PERIOD_DAYS["近一月"] == 30
+        assert len(source._filter_by_period(data, "近一周")) == 1
+        assert len(source._filter_by_period(data, "近三月")) == 3
+        assert source._filter_by_period(data, "成立以来") == data
+        assert source._filter_by_period([], "近一年") == []
+
 
 # ============================================================================
 # SinaFundDataSource 类测试
@@ -555,8 +525,6 @@ class TestSinaFundDataSource:
 
     def test_init(self):
         """测试初始化"""
-        from src.datasources.fund_source import SinaFundDataSource
-
         source = SinaFundDataSource()
         assert source.name == "fund_sina"
         assert source.source_type == DataSourceType.FUND
@@ -565,8 +533,6 @@ class TestSinaFundDataSource:
     @pytest.mark.asyncio
     async def test_fetch_invalid_code(self):
         """测试无效基金代码"""
-        from src.datasources.fund_source import SinaFundDataSource
-
         source = SinaFundDataSource()
         result = await source.fetch("invalid")
 
@@ -575,8 +541,6 @@ class TestSinaFundDataSource:
 
     def test_safe_float(self):
         """测试 _safe_float 方法"""
-        from src.datasources.fund_source import SinaFundDataSource
-
         source = SinaFundDataSource()
         assert source._safe_float("1.23") == 1.23
         assert source._safe_float(None) is None
@@ -593,8 +557,6 @@ class TestEastMoneyFundDataSource:
 
     def test_init(self):
         """测试初始化"""
-        from src.datasources.fund_source import EastMoneyFundDataSource
-
         source = EastMoneyFundDataSource()
         assert source.name == "fund_eastmoney"
         assert source.source_type == DataSourceType.FUND
@@ -602,8 +564,6 @@ class TestEastMoneyFundDataSource:
     @pytest.mark.asyncio
     async def test_fetch_invalid_code(self):
         """测试无效基金代码"""
-        from src.datasources.fund_source import EastMoneyFundDataSource
-
         source = EastMoneyFundDataSource()
         result = await source.fetch("invalid")
 
@@ -621,8 +581,6 @@ class TestFund123DataSource:
 
     def test_init(self):
         """测试初始化"""
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         assert source.name == "fund123"
         assert source.source_type == DataSourceType.FUND
@@ -631,8 +589,6 @@ class TestFund123DataSource:
     @pytest.mark.asyncio
     async def test_fetch_invalid_code(self):
         """测试无效基金代码"""
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         result = await source.fetch("invalid")
 
@@ -642,8 +598,6 @@ class TestFund123DataSource:
     @pytest.mark.asyncio
     async def test_fetch_intraday_invalid_code(self):
         """测试日内数据获取无效基金代码"""
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         result = await source.fetch_intraday("invalid")
 
@@ -652,16 +606,12 @@ class TestFund123DataSource:
 
     def test_validate_fund_code(self):
         """测试基金代码验证"""
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         assert source._validate_fund_code("161039") is True
         assert source._validate_fund_code("invalid") is False
 
     def test_safe_float(self):
         """测试 _safe_float 方法"""
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         assert source._safe_float("1.23") == 1.23
         assert source._safe_float(None) is None
@@ -674,8 +624,6 @@ class TestFund123DataSourceCSRF:
     @pytest.mark.asyncio
     async def test_get_csrf_token_from_cache(self):
         """测试从缓存获取 CSRF token"""
-        from src.datasources.fund.fund123_client import Fund123Client
-
         # 设置缓存的 token（通过单例实例）
         client = Fund123Client.get_instance()
         client._csrf_token = "test_token_123"
@@ -699,8 +647,6 @@ class TestFundHistoryYFinanceSource:
 
     def test_init(self):
         """测试初始化"""
-        from src.datasources.fund_source import FundHistoryYFinanceSource
-
         source = FundHistoryYFinanceSource()
         assert source.name == "fund_history_yfinance"
         assert source.source_type == DataSourceType.FUND
@@ -708,8 +654,6 @@ class TestFundHistoryYFinanceSource:
     @pytest.mark.asyncio
     async def test_fetch_batch_empty(self):
         """测试批量获取空参数"""
-        from src.datasources.fund_source import FundHistoryYFinanceSource
-
         source = FundHistoryYFinanceSource()
         results = await source.fetch_batch()
 
@@ -728,8 +672,6 @@ class TestGetFundCacheStats:
 
     def test_returns_dict(self):
         """测试返回字典"""
-        from src.datasources.fund_source import get_fund_cache_stats
-
         stats = get_fund_cache_stats()
 
         assert isinstance(stats, dict)
@@ -738,8 +680,6 @@ class TestGetFundCacheStats:
 
     def test_fund_info_cache_stats(self):
         """测试基金信息缓存统计"""
-        from src.datasources.fund_source import get_fund_cache_stats
-
         stats = get_fund_cache_stats()
 
         assert "hit_count" in stats["fund_info_cache"]
@@ -758,8 +698,6 @@ class TestIsAfterMarketClose:
 
     def test_returns_bool(self):
         """测试返回布尔值"""
-        from src.datasources.fund_source import _is_after_market_close
-
         result = _is_after_market_close()
         assert isinstance(result, bool)
 
@@ -774,8 +712,6 @@ class TestGetLatestTradingDay:
 
     def test_returns_string_or_none(self):
         """测试返回字符串或 None"""
-        from src.datasources.fund_source import _get_latest_trading_day
-
         result = _get_latest_trading_day()
         assert result is None or isinstance(result, str)
 
@@ -790,8 +726,6 @@ class TestIsNetValueCacheValid:
 
     def test_returns_tuple(self):
         """测试返回元组"""
-        from src.datasources.fund_source import _is_net_value_cache_valid
-
         result = _is_net_value_cache_valid("161039")
         assert isinstance(result, tuple)
         assert len(result) == 3
@@ -808,8 +742,6 @@ class TestCloseClient:
     @pytest.mark.asyncio
     async def test_fund_data_source_close(self):
         """测试 TiantianFundDataSource 关闭客户端"""
-        from src.datasources.fund_source import TiantianFundDataSource
-
         source = TiantianFundDataSource()
         await source.close()
 
@@ -823,9 +755,6 @@ class TestCloseClient:
     @pytest.mark.asyncio
     async def test_fund123_data_source_close(self):
         """测试 Fund123DataSource 关闭客户端"""
-        from src.datasources.fund.fund123_client import Fund123Client
-        from src.datasources.fund_source import Fund123DataSource
-
         source = Fund123DataSource()
         await source.close()
 
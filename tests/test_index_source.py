@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.datasources.base import DataSourceType
+from src.datasources.base import DataSourceResult, DataSourceType
 from src.datasources.index_source import (
     INDEX_REGIONS,
     INDEX_TICKERS,
@@ -93,12 +93,35 @@ class TestYahooIndexSource:
         assert ds.timeout == 10.0
 
 
+@pytest.fixture(scope="module")
+async def hybrid_source():
+    """模块内共享的混合指数数据源，子数据源的 fetch 通过 monkeypatch 替换并在用例结束后还原"""
+    source = HybridIndexSource()
+    yield source
+    await source.close()
+
+
+@pytest.fixture
+def tencent_fetch(hybrid_source, monkeypatch):
+    """替换腾讯子数据源的 fetch，返回成功结果"""
+    mock_fetch = AsyncMock(
+        return_value=DataSourceResult(
+            success=True,
+            data=[{"name": "shanghai", "price": 3500}],
+            timestamp=1000.0,
+            source="tencent",
+        )
+    )
+    monkeypatch.setattr(hybrid_source._tencent, "fetch", mock_fetch)
+    return mock_fetch
+
+
 class TestHybridIndexSource:
     """测试混合指数数据源"""
 
-    def test_init(self):
+    def test_init(self, hybrid_source):
         """测试初始化"""
-        ds = HybridIndexSource()
+        ds = hybrid_source
 
         assert ds.name == "hybrid_index"
         assert ds.source_type == DataSourceType.STOCK  # 复用 STOCK 类型
@@ -106,31 +129,17 @@ class TestHybridIndexSource:
         assert ds._yahoo is not None
 
     @pytest.mark.asyncio
-    async def test_fetch_tencent_index(self):
+    async def test_fetch_tencent_index(self, hybrid_source, tencent_fetch):
         """测试获取腾讯指数"""
-        ds = HybridIndexSource()
-
-        # Mock 腾讯数据源
-        from src.datasources.base import DataSourceResult
-
-        mock_result = DataSourceResult(
-            success=True,
-            data=[{"name": "shanghai", "price": 3500}],
-            timestamp=1000.0,
-            source="tencent",
-        )
-        ds._tencent.fetch = AsyncMock(return_value=mock_result)
-
-        result = await ds.fetch("shanghai")
+        result = await hybrid_source.fetch("shanghai")
 
         assert result.success is True
+        tencent_fetch.assert_awaited_once_with("shanghai")
 
     @pytest.mark.asyncio
-    async def test_fetch_yahoo_index(self):
+    async def test_fetch_yahoo_index(self, hybrid_source, monkeypatch):
         """测试获取 Yahoo 指数"""
-        ds = HybridIndexSource()
-
-        from src.datasources.base import DataSourceResult
+        ds = hybrid_source
 
         mock_result = DataSourceResult(
             success=True,
@@ -138,30 +147,29 @@ class TestHybridIndexSource:
             timestamp=1000.0,
             source="yahoo",
         )
-        ds._yahoo.fetch = AsyncMock(return_value=mock_result)
+        monkeypatch.setattr(ds._yahoo, "fetch", AsyncMock(return_value=mock_result))
 
         result = await ds.fetch("nikkei225")
 
         assert result.success is True
 
     @pytest.mark.asyncio
-    async def test_fetch_batch(self):
+    async def test_fetch_batch(self, hybrid_source, tencent_fetch):
         """测试批量获取"""
-        ds = HybridIndexSource()
-
-        from src.datasources.base import DataSourceResult
-
-        mock_result = DataSourceResult(success=True, data=[{}], timestamp=1000.0, source="test")
-        ds._tencent.fetch = AsyncMock(return_value=mock_result)
-
-        results = await ds.fetch_batch(["shanghai", "shenzhen"])
+        results = await hybrid_source.fetch_batch(["shanghai", "shenzhen"])
 
         assert len(results) == 2
+        assert tencent_fetch.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_close(self):
-        """测试关闭"""
-        ds = HybridIndexSource()
+    async def test_close(self, hybrid_source, monkeypatch):
+        """测试关闭时依次关闭腾讯与 Yahoo 子数据源"""
+        tencent_close = AsyncMock()
+        yahoo_close = AsyncMock()
+        monkeypatch.setattr(hybrid_source._tencent, "close", tencent_close)
+        monkeypatch.setattr(hybrid_source._yahoo, "close", yahoo_close)
+
+        await hybrid_source.close()
 
-        # 应该不会抛出异常
-        await ds.close()
+        tencent_close.assert_awaited_once()
+        yahoo_close.assert_awaited_once()
@@ -4,205 +4,171 @@ QDII/FOF 基金核心功能单元测试
 
 测试以下功能：
 1. QDII/FOF 基金类型识别逻辑
-2. _calculate_estimate_change 函数
-3. _check_is_holding 函数
-4. build_fund_response 函数
+2. _check_is_holding 函数
+3. build_fund_response 函数
+
+_calculate_estimate_change 的测试见 test_estimate_change.py
 """
 
-from unittest.mock import MagicMock
+from collections import namedtuple
+from unittest.mock import MagicMock, NonCallableMagicMock
 
 import pytest
 
+from api.routes.funds import _check_is_holding, build_fund_response
+from src.config.models import FundList
+from src.datasources.fund_source import _has_real_time_estimate
 
-class TestQdiiFofTypeRecognition:
-    """测试 QDII/FOF 基金类型识别逻辑"""
+# _check_is_holding 只读取持仓的 code 字段
+Holding = namedtuple("Holding", ["code"])
 
-    def test_qdii_type_from_name_with_parentheses(self):
-        """测试 "(QDII)" 后缀识别"""
-        from api.routes.funds import build_fund_response
 
-        # 基金名称包含 "(QDII)"
-        data = {
-            "fund_code": "470888",
-            "name": "华夏全球精选股票(QDII)",
-            "type": "QDII",
-            "unit_net_value": 1.5,
-            "estimated_net_value": 1.52,
-            "estimated_growth_rate": 1.33,
-            "net_value_date": "2024-01-10",
-            "estimate_time": "2024-01-10 15:00",
-            "has_real_time_estimate": False,
-        }
-
-        response = build_fund_response(data, source="tiantian")
-
-        assert response["type"] == "QDII"
-        assert response["hasRealTimeEstimate"] is False
+def _assert_fund(response, **expected):
+    """逐字段比较 build_fund_response 的输出，布尔值和 None 按 is 比较"""
+    for key, value in expected.items():
+        if value is None or isinstance(value, bool):
+            assert response[key] is value, key
+        else:
+            assert response[key] == value, key
 
-    def test_qdii_type_from_name_without_parentheses(self):
-        """测试 "QDII" 后缀识别（无括号）"""
-        from api.routes.funds import build_fund_response
 
-        # 基金名称以 "QDII" 结尾
-        data = {
-            "fund_code": "000001",
-            "name": "上投摩根全球新兴市场QDII",
-            "type": "QDII",
-            "unit_net_value": 1.2,
-            "estimated_net_value": 1.18,
-            "estimated_growth_rate": -1.67,
-            "net_value_date": "2024-01-10",
-            "estimate_time": "2024-01-10 15:00",
-            "has_real_time_estimate": False,
-        }
-
-        response = build_fund_response(data, source="tiantian")
-
-        assert response["type"] == "QDII"
-        assert response["hasRealTimeEstimate"] is False
-
-    def test_fof_type_from_name(self):
-        """测试 FOF 类型识别 - 普通 FOF 有实时估值"""
-        from api.routes.funds import build_fund_response
-
-        # 基金名称包含 FOF
-        data = {
-            "fund_code": "005217",
-            "name": "交银施罗德安享稳健养老目标一年持有FOF",
-            "type": "FOF",
-            "unit_net_value": 1.08,
-            "estimated_net_value": 1.09,
-            "estimated_growth_rate": 0.93,
-            "net_value_date": "2024-01-10",
-            "estimate_time": "2024-01-10 15:00",
-            "has_real_time_estimate": True,  # 普通 FOF 有实时估值
-        }
-
-        response = build_fund_response(data, source="tiantian")
-
-        assert response["type"] == "FOF"
-        assert response["hasRealTimeEstimate"] is True
-
-    def test_fof_type_from_name_with_parentheses(self):
-        """测试 "(FOF)" 后缀识别 - 普通 FOF 有实时估值"""
-        from api.routes.funds import build_fund_response
+class TestQdiiFofTypeRecognition:
+    """测试 QDII/FOF 基金类型识别逻辑"""
 
-        # 基金名称包含 "(FOF)"
-        data = {
-            "fund_code": "006289",
-            "name": "中银添利稳健养老目标一年(FOF)",
-            "type": "FOF",
-            "unit_net_value": 1.05,
-            "estimated_net_value": 1.06,
-            "estimated_growth_rate": 0.95,
-            "net_value_date": "2024-01-10",
-            "estimate_time": "2024-01-10 15:00",
-            "has_real_time_estimate": True,  # 普通 FOF 有实时估值
-        }
+    @pytest.mark.parametrize(
+        "override, expected_type, expected_real_time",
+        [
+            # 基金名称包含 "(QDII)"
+            (
+                {"fund_code": "470888", "name": "华夏全球精选股票(QDII)", "type": "QDII"},
+                "QDII",
+                False,
+            ),
+            # 基金名称以 "QDII" 结尾（无括号）
+            (
+                {"fund_code": "000001", "name": "上投摩根全球新兴市场QDII", "type": "QDII"},
+                "QDII",
+                False,
+            ),
+            # 基金名称包含 FOF - 普通 FOF 有实时估值
+            (
+                {
+                    "fund_code": "005217",
+                    "name": "交银施罗德安享稳健养老目标一年持有FOF",
+                    "type": "FOF",
+                    "has_real_time_estimate": True,
+                },
+                "FOF",
+                True,
+            ),
+            # 基金名称包含 "(FOF)" - 普通 FOF 有实时估值
+            (
+                {
+                    "fund_code": "006289",
+                    "name": "中银添利稳健养老目标一年(FOF)",
+                    "type": "FOF",
+                    "has_real_time_estimate": True,
+                },
+                "FOF",
+                True,
+            ),
+        ],
+    )
+    def test_type_recognition(
+        self, fund_data_template, override, expected_type, expected_real_time
+    ):
+        """测试 QDII/FOF 类型识别及实时估值标记"""
+        data = {**fund_data_template, **override}
 
         response = build_fund_response(data, source="tiantian")
 
-        assert response["type"] == "FOF"
-        assert response["hasRealTimeEstimate"] is True
+        assert response["type"] == expected_type
+        assert response["hasRealTimeEstimate"] is expected_real_time
 
 
 class TestHasRealTimeEstimate:
     """测试 hasRealTimeEstimate 字段"""
 
-    def test_has_real_time_estimate_for_qdii(self):
-        """测试 QDII 基金 hasRealTimeEstimate 为 False"""
-        from api.routes.funds import build_fund_response
-
-        data = {
-            "fund_code": "470888",
-            "name": "华夏全球精选股票(QDII)",
-            "type": "QDII",
-            "unit_net_value": 1.5,
-            "has_real_time_estimate": False,
-        }
-
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            # QDII 基金为 False
+            (
+                {
+                    "fund_code": "470888",
+                    "name": "华夏全球精选股票(QDII)",
+                    "type": "QDII",
+                    "unit_net_value": 1.5,
+                    "has_real_time_estimate": False,
+                },
+                False,
+            ),
+            # 普通基金为 True
+            (
+                {
+                    "fund_code": "161039",
+                    "name": "富国中证新能源汽车指数",
+                    "type": "股票型",
+                    "unit_net_value": 2.0,
+                    "has_real_time_estimate": True,
+                },
+                True,
+            ),
+            # 未指定 has_real_time_estimate 时默认为 True
+            (
+                {
+                    "fund_code": "161039",
+                    "name": "富国中证新能源汽车指数",
+                    "type": "股票型",
+                    "unit_net_value": 2.0,
+                },
+                True,
+            ),
+            # 国内 FOF 为 True（底层资产是国内基金）
+            (
+                {
+                    "fund_code": "005217",
+                    "name": "交银施罗德安享稳健养老目标一年持有FOF",
+                    "type": "FOF",
+                    "has_real_time_estimate": True,
+                },
+                True,
+            ),
+            # 投资海外的 FOF 为 False：名称包含"海外"/"全球"，或 QDII-FOF
+            (
+                {
+                    "fund_code": "005218",
+                    "name": "某海外投资FOF",
+                    "type": "FOF",
+                    "has_real_time_estimate": False,
+                },
+                False,
+            ),
+            (
+                {
+                    "fund_code": "005219",
+                    "name": "某全球配置FOF",
+                    "type": "FOF",
+                    "has_real_time_estimate": False,
+                },
+                False,
+            ),
+            (
+                {
+                    "fund_code": "005220",
+                    "name": "某QDII-FOF",
+                    "type": "FOF",
+                    "has_real_time_estimate": False,
+                },
+                False,
+            ),
+        ],
+    )
+    def test_has_real_time_estimate(self, data, expected):
+        """测试 hasRealTimeEstimate 取自 has_real_time_estimate，缺省为 True"""
         response = build_fund_response(data)
 
-        assert response["hasRealTimeEstimate"] is False
-
-    def test_has_real_time_estimate_for_normal(self):
-        """测试普通基金 hasRealTimeEstimate 为 True"""
-        from api.routes.funds import build_fund_response
-
-        data = {
-            "fund_code": "161039",
-            "name": "富国中证新能源汽车指数",
-            "type": "股票型",
-            "unit_net_value": 2.0,
-            "has_real_time_estimate": True,
-        }
-
-        response = build_fund_response(data)
-
-        assert response["hasRealTimeEstimate"] is True
-
-    def test_has_real_time_estimate_defaults_to_true(self):
-        """测试 hasRealTimeEstimate 默认值为 True"""
-        from api.routes.funds import build_fund_response
-
-        data = {
-            "fund_code": "161039",
-            "name": "富国中证新能源汽车指数",
-            "type": "股票型",
-            "unit_net_value": 2.0,
-            # 未指定 has_real_time_estimate
-        }
-
-        response = build_fund_response(data)
-
-        assert response["hasRealTimeEstimate"] is True
-
-    def test_has_real_time_estimate_for_fof_domestic(self):
-        """国内 FOF 基金 hasRealTimeEstimate 应为 True（底层资产是国内基金）"""
-        from api.routes.funds import build_fund_response
-
-        data = {
-            "fund_code": "005217",
-            "name": "交银施罗德安享稳健养老目标一年持有FOF",
-            "type": "FOF",
-            "has_real_time_estimate": True,
-        }
-        response = build_fund_response(data)
-        assert response["hasRealTimeEstimate"] is True
-
-    def test_has_real_time_estimate_for_fof_overseas(self):
-        """投资海外的 FOF 基金 hasRealTimeEstimate 应为 False"""
-        from api.routes.funds import build_fund_response
-
-        # 名称包含"海外"
-        data = {
-            "fund_code": "005218",
-            "name": "某海外投资FOF",
-            "type": "FOF",
-            "has_real_time_estimate": False,
-        }
-        response = build_fund_response(data)
-        assert response["hasRealTimeEstimate"] is False
-
-        # 名称包含"全球"
-        data = {
-            "fund_code": "005219",
-            "name": "某全球配置FOF",
-            "type": "FOF",
-            "has_real_time_estimate": False,
-        }
-        response = build_fund_response(data)
-        assert response["hasRealTimeEstimate"] is False
-
-        # QDII-FOF
-        data = {
-            "fund_code": "005220",
-            "name": "某QDII-FOF",
-            "type": "FOF",
-            "has_real_time_estimate": False,
-        }
-        response = build_fund_response(data)
-        assert response["hasRealTimeEstimate"] is False
+        assert response["hasRealTimeEstimate"] is expected
 
 
 class TestHasRealTimeEstimateFunction:
@@ -210,30 +176,22 @@ class TestHasRealTimeEstimateFunction:
 
     def test_qdii_no_real_time(self):
         """QDII 基金无实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("QDII", "华夏全球精选") is False
 
     def test_normal_fund_has_real_time(self):
         """普通基金有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         assert _has_real_time_estimate("股票型", "富国中证新能源汽车指数") is True
         assert _has_real_time_estimate("混合型", "某混合基金") is True
         assert _has_real_time_estimate("债券型", "某债券基金") is True
 
     def test_fof_domestic_has_real_time(self):
         """国内 FOF 有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # 普通 FOF（名称不含海外/全球/QDII）
         assert _has_real_time_estimate("FOF", "交银施罗德安享稳健养老目标一年持有FOF") is True
         assert _has_real_time_estimate("FOF", "中银添利稳健养老目标一年(FOF)") is True
 
     def test_fof_overseas_no_real_time(self):
         """投资海外的 FOF 无实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # 名称包含"海外"
         assert _has_real_time_estimate("FOF", "某海外投资FOF") is False
         # 名称包含"全球"
@@ -243,23 +201,17 @@ class TestHasRealTimeEstimateFunction:
 
     def test_etf_link_has_real_time(self):
         """ETF-联接基金有实时估值"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # ETF-联接基金跟踪国内基金，有实时估值
         assert _has_real_time_estimate("ETF-联接", "华夏上证50ETF联接") is True
 
     def test_empty_type_returns_false(self):
         """空类型时保守返回 True（大多数基金有实时估值）"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # 空类型时尝试从名称推断，仍无法判断时保守返回 True
         assert _has_real_time_estimate("", "某基金") is True
         assert _has_real_time_estimate(None, "某基金") is True  # type: ignore
 
     def test_none_fund_name_safe_handling(self):
         """fund_name 为 None 时安全处理"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # fund_name 为 None 时不应抛出异常
         # QDII 类型无论 name 如何都返回 False
         assert _has_real_time_estimate("QDII", None) is False  # type: ignore
@@ -272,147 +224,55 @@ class TestHasRealTimeEstimateFunction:
 
     def test_case_insensitive_qdii_detection(self):
         """QDII 检测不区分大小写"""
-        from src.datasources.fund_source import _has_real_time_estimate
-
         # FOF 中检测 QDII（大小写不敏感）
         assert _has_real_time_estimate("FOF", "某qdii-fof基金") is False
         assert _has_real_time_estimate("FOF", "某Qdii-FOF基金") is False
 
 
-class TestCalculateEstimateChange:
-    """测试 _calculate_estimate_change 函数"""
-
-    def test_calculate_estimate_change_normal(self):
-        """正常情况 - 计算估算涨跌额"""
-        from api.routes.funds import _calculate_estimate_change
-
-        # 正常情况：单位净值 1.5，估算净值 1.52，涨跌额应该是 0.02
-        result = _calculate_estimate_change(unit_net=1.5, estimate_net=1.52)
-
-        assert result == 0.02
-
-    def test_calculate_estimate_change_negative(self):
-        """计算负向涨跌额"""
-        from api.routes.funds import _calculate_estimate_change
-
-        # 单位净值 1.5，估算净值 1.48，涨跌额应该是 -0.02
-        result = _calculate_estimate_change(unit_net=1.5, estimate_net=1.48)
-
-        assert result == -0.02
-
-    def test_calculate_estimate_change_zero_unit_net(self):
-        """单位净值为 0 时减法运算仍然有效"""
-        from api.routes.funds import _calculate_estimate_change
-
-        # 单位净值为 0（边界值，减法运算仍然有效）
-        result = _calculate_estimate_change(unit_net=0.0, estimate_net=1.52)
-
-        assert result == 1.52
-
-    def test_calculate_estimate_change_none_unit_net(self):
-        """单位净值为 None 时应返回 None"""
-        from api.routes.funds import _calculate_estimate_change
-
-        result = _calculate_estimate_change(unit_net=None, estimate_net=1.52)
-
-        assert result is None
-
-    def test_calculate_estimate_change_none_estimate_net(self):
-        """估算净值为 None 时应返回 None"""
-        from api.routes.funds import _calculate_estimate_change
-
-        result = _calculate_estimate_change(unit_net=1.5, estimate_net=None)
-
-        assert result is None
-
-    def test_calculate_estimate_change_both_none(self):
-        """两个参数都为 None 时应返回 None"""
-        from api.routes.funds import _calculate_estimate_change
+@pytest.fixture
+def mock_cfg_mgr():
+    """模拟 ConfigManager，通过 set_holdings(codes) 设置持仓代码"""
+    cfg_mgr = MagicMock()
 
-        result = _calculate_estimate_change(unit_net=None, estimate_net=None)
+    def set_holdings(codes):
+        fund_list = NonCallableMagicMock(spec_set=FundList())
+        fund_list.holdings = [Holding(c) for c in codes]
+        cfg_mgr.load_funds.return_value = fund_list
 
-        assert result is None
-
-    def test_calculate_estimate_change_rounding(self):
-        """测试四舍五入"""
-        from api.routes.funds import _calculate_estimate_change
-
-        # 结果应该四舍五入到 4 位小数
-        result = _calculate_estimate_change(unit_net=1.123456, estimate_net=1.654321)
-
-        assert result == round(1.654321 - 1.123456, 4)
-
-    def test_calculate_estimate_change_extreme_values(self):
-        """测试极端值场景"""
-        from api.routes.funds import _calculate_estimate_change
-
-        # 大数计算
-        result = _calculate_estimate_change(unit_net=1000000.0, estimate_net=1000000.1234)
-        assert result == 0.1234
-
-        # 极小数值
-        result = _calculate_estimate_change(unit_net=0.0001, estimate_net=0.0002)
-        assert result == 0.0001
+    cfg_mgr.set_holdings = set_holdings
+    return cfg_mgr
 
 
 class TestCheckIsHolding:
     """测试 _check_is_holding 函数"""
 
-    def test_check_is_holding_with_holding(self):
+    def test_check_is_holding_with_holding(self, mock_cfg_mgr):
         """持仓中 - 应返回 True"""
-        from api.routes.funds import _check_is_holding
-
-        # 模拟持仓数据
-        mock_fund_list = MagicMock()
-        mock_fund_list.holdings = [
-            MagicMock(code="000001"),
-            MagicMock(code="000002"),
-            MagicMock(code="161039"),
-        ]
-        mock_cfg_mgr = MagicMock()
-        mock_cfg_mgr.load_funds.return_value = mock_fund_list
+        mock_cfg_mgr.set_holdings(["000001", "000002", "161039"])
 
         result = _check_is_holding("000001", mock_cfg_mgr)
 
         assert result is True
 
-    def test_check_is_holding_without_holding(self):
+    def test_check_is_holding_without_holding(self, mock_cfg_mgr):
         """未持仓 - 应返回 False"""
-        from api.routes.funds import _check_is_holding
-
-        # 模拟持仓数据
-        mock_fund_list = MagicMock()
-        mock_fund_list.holdings = [
-            MagicMock(code="000001"),
-            MagicMock(code="000002"),
-        ]
-        mock_cfg_mgr = MagicMock()
-        mock_cfg_mgr.load_funds.return_value = mock_fund_list
+        mock_cfg_mgr.set_holdings(["000001", "000002"])
 
         result = _check_is_holding("999999", mock_cfg_mgr)
 
         assert result is False
 
-    def test_check_is_holding_empty_holdings(self):
+    def test_check_is_holding_empty_holdings(self, mock_cfg_mgr):
         """空持仓列表 - 应返回 False"""
-        from api.routes.funds import _check_is_holding
-
-        # 模拟空持仓
-        mock_fund_list = MagicMock()
-        mock_fund_list.holdings = []
-        mock_cfg_mgr = MagicMock()
-        mock_cfg_mgr.load_funds.return_value = mock_fund_list
+        mock_cfg_mgr.set_holdings([])
 
         result = _check_is_holding("000001", mock_cfg_mgr)
 
         assert result is False
 
-    def test_check_is_holding_exception(self):
+    def test_check_is_holding_exception(self, mock_cfg_mgr):
         """加载失败时返回 False"""
-        from api.routes.funds import _check_is_holding
-
         # 模拟加载异常
-        mock_cfg_mgr = MagicMock()
         mock_cfg_mgr.load_funds.side_effect = Exception("Config error")
 
         result = _check_is_holding("000001", mock_cfg_mgr)
@@ -425,8 +285,6 @@ class TestBuildFundResponse:
 
     def test_build_fund_response_with_qdii(self):
         """QDII 基金测试"""
-        from api.routes.funds import build_fund_response
-
         data = {
             "fund_code": "470888",
             "name": "华夏全球精选股票(QDII)",
@@ -443,21 +301,22 @@ class TestBuildFundResponse:
 
         response = build_fund_response(data, source="tiantian", is_holding=True)
 
-        assert response["code"] == "470888"
-        assert response["name"] == "华夏全球精选股票(QDII)"
-        assert response["type"] == "QDII"
-        assert response["netValue"] == 1.5
-        assert response["estimateValue"] == 1.52
-        assert response["estimateChange"] == 0.02
-        assert response["estimateChangePercent"] == 2.67
-        assert response["source"] == "tiantian"
-        assert response["isHolding"] is True
-        assert response["hasRealTimeEstimate"] is False
+        _assert_fund(
+            response,
+            code="470888",
+            name="华夏全球精选股票(QDII)",
+            type="QDII",
+            netValue=1.5,
+            estimateValue=1.52,
+            estimateChange=0.02,
+            estimateChangePercent=2.67,
+            source="tiantian",
+            isHolding=True,
+            hasRealTimeEstimate=False,
+        )
 
     def test_build_fund_response_with_normal(self):
         """普通基金测试"""
-        from api.routes.funds import build_fund_response
-
         data = {
             "fund_code": "161039",
             "name": "富国中证新能源汽车指数",
@@ -472,20 +331,21 @@ class TestBuildFundResponse:
 
         response = build_fund_response(data, source="eastmoney", is_holding=False)
 
-        assert response["code"] == "161039"
-        assert response["name"] == "富国中证新能源汽车指数"
-        assert response["type"] == "股票型"
-        assert response["netValue"] == 2.0
-        assert response["estimateValue"] == 2.05
-        assert response["estimateChange"] == 0.05
-        assert response["source"] == "eastmoney"
-        assert response["isHolding"] is False
-        assert response["hasRealTimeEstimate"] is True
+        _assert_fund(
+            response,
+            code="161039",
+            name="富国中证新能源汽车指数",
+            type="股票型",
+            netValue=2.0,
+            estimateValue=2.05,
+            estimateChange=0.05,
+            source="eastmoney",
+            isHolding=False,
+            hasRealTimeEstimate=True,
+        )
 
     def test_build_fund_response_with_fof(self):
         """FOF 基金测试 - 普通 FOF 有实时估值"""
-        from api.routes.funds import build_fund_response
-
         data = {
             "fund_code": "005217",
             "name": "交银施罗德安享稳健养老目标一年持有FOF",
@@ -506,8 +366,6 @@ class TestBuildFundResponse:
 
     def test_build_fund_response_missing_fields(self):
         """测试缺失字段的处理"""
-        from api.routes.funds import build_fund_response
-
         data = {
             "fund_code": "161039",
             "name": "富国中证新能源汽车指数",
@@ -516,27 +374,24 @@ class TestBuildFundResponse:
 
         response = build_fund_response(data)
 
-        assert response["code"] == "161039"
-        assert response["name"] == "富国中证新能源汽车指数"
-        assert response["type"] is None
-        assert response["netValue"] is None
-        assert response["estimateValue"] is None
-        assert response["estimateChange"] is None
-        assert response["hasRealTimeEstimate"] is True  # 默认值
-
-    def test_build_fund_response_with_etf_link(self):
+        _assert_fund(
+            response,
+            code="161039",
+            name="富国中证新能源汽车指数",
+            type=None,
+            netValue=None,
+            estimateValue=None,
+            estimateChange=None,
+            hasRealTimeEstimate=True,  # 默认值
+        )
+
+    def test_build_fund_response_with_etf_link(self, fund_data_template):
         """ETF-联接基金测试 - 应有实时估值（底层资产是国内基金）"""
-        from api.routes.funds import build_fund_response
-
         data = {
+            **fund_data_template,
             "fund_code": "510500",
             "name": "华夏上证50ETF联接",
             "type": "ETF-联接",
-            "unit_net_value": 1.5,
-            "net_value_date": "2024-01-10",
-            "estimated_net_value": 1.52,
-            "estimated_growth_rate": 1.33,
-            "estimate_time": "2024-01-10 15:00",
             "has_real_time_estimate": True,  # ETF-联接基金有实时估值
         }
 
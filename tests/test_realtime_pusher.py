@@ -571,6 +571,7 @@ class TestRealtimePusherPushLoops:
         mock_ws_manager = MagicMock(spec=WebSocketManager)
         mock_ws_manager.broadcast_to_subscription = AsyncMock(return_value=1)
         mock_ws_manager.get_subscriptions_info = MagicMock(return_value={})
+        mock_ws_manager.get_subscribers = MagicMock(return_value=frozenset({"client-1"}))
 
         return mock_data_manager, mock_ws_manager
 
@@ -689,6 +690,75 @@ class TestRealtimePusherPushLoops:
         # 应该只推送成功的数据，验证广播被调用
         assert mock_ws_manager.broadcast_to_subscription.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_push_funds_loop_no_changes(self, mock_dependencies):
+        """测试基金推送循环 - 数据无变化"""
+        mock_data_manager, mock_ws_manager = mock_dependencies
+        mock_ws_manager.get_subscriptions_info = MagicMock(return_value={"funds": 1})
+
+        mock_result = DataSourceResult(
+            success=True,
+            data={"code": "000001", "net_value": 1.5},
+            source="test",
+        )
+        mock_data_manager.fetch_batch = AsyncMock(return_value=[mock_result])
+
+        pusher = RealtimePusher(
+            data_source_manager=mock_data_manager,
+            websocket_manager=mock_ws_manager,
+        )
+        pusher._running = True
+        pusher._last_fund_data = [{"code": "000001", "net_value": 1.5}]
+        pusher._fund_subscribers = frozenset({"client-1"})
+
+        with patch.object(pusher, "_get_fund_codes", return_value=["000001"]):
+            with patch.object(pusher, "_is_trading_hours", return_value=True):
+                with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                    mock_sleep.side_effect = [None, Exception("Stop loop")]
+                    try:
+                        await pusher._push_funds_loop()
+                    except Exception:
+                        pass
+
+        # 数据无变化，不应该广播
+        mock_ws_manager.broadcast_to_subscription.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_push_funds_loop_no_changes_new_subscriber(self, mock_dependencies):
+        """测试基金推送循环 - 数据无变化但有新订阅者时补发完整数据"""
+        mock_data_manager, mock_ws_manager = mock_dependencies
+        mock_ws_manager.get_subscriptions_info = MagicMock(return_value={"funds": 2})
+        mock_ws_manager.get_subscribers = MagicMock(
+            return_value=frozenset({"client-1", "client-2"})
+        )
+
+        mock_result = DataSourceResult(
+            success=True,
+            data={"code": "000001", "net_value": 1.5},
+            source="test",
+        )
+        mock_data_manager.fetch_batch = AsyncMock(return_value=[mock_result])
+
+        pusher = RealtimePusher(
+            data_source_manager=mock_data_manager,
+            websocket_manager=mock_ws_manager,
+        )
+        pusher._running = True
+        pusher._last_fund_data = [{"code": "000001", "net_value": 1.5}]
+        pusher._fund_subscribers = frozenset({"client-1"})
+
+        with patch.object(pusher, "_get_fund_codes", return_value=["000001"]):
+            with patch.object(pusher, "_is_trading_hours", return_value=False):
+                with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                    mock_sleep.side_effect = [None, Exception("Stop loop")]
+                    try:
+                        await pusher._push_funds_loop()
+                    except Exception:
+                        pass
+
+        mock_ws_manager.broadcast_to_subscription.assert_called_once()
+        assert pusher._fund_subscribers == frozenset({"client-1", "client-2"})
+
     @pytest.mark.asyncio
     async def test_push_commodities_loop_success(self, mock_dependencies):
         """测试商品推送循环 - 成功推送"""
@@ -1,6 +1,8 @@
 # -*- coding: UTF-8 -*-
 """设置功能测试"""
 
+import pytest
+
 from src.config.models import AppConfig, Theme
 
 
@@ -35,25 +37,21 @@ class TestAppConfig:
 class TestConfigValidation:
     """配置验证测试"""
 
-    def test_refresh_interval_bounds(self):
-        """测试刷新间隔边界"""
-        # 最小值
-        config = AppConfig(refresh_interval=10)
-        assert config.refresh_interval == 10
-
-        # 最大值
-        config = AppConfig(refresh_interval=300)
-        assert config.refresh_interval == 300
-
-    def test_history_points_bounds(self):
-        """测试历史数据点数边界"""
-        # 最小值
-        config = AppConfig(max_history_points=50)
-        assert config.max_history_points == 50
-
-        # 最大值
-        config = AppConfig(max_history_points=500)
-        assert config.max_history_points == 500
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            # 刷新间隔最小值/最大值
+            ("refresh_interval", 10),
+            ("refresh_interval", 300),
+            # 历史数据点数最小值/最大值
+            ("max_history_points", 50),
+            ("max_history_points", 500),
+        ],
+    )
+    def test_bounds(self, field, value):
+        """测试刷新间隔与历史数据点数边界"""
+        config = AppConfig(**{field: value})
+        assert getattr(config, field) == value
 
     def test_theme_values(self):
         """测试主题值"""
@@ -5,10 +5,12 @@
 """
 
 from datetime import date, datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.datasources import trading_calendar_source
+from src.datasources.cache import DataCache
 from src.datasources.trading_calendar_source import (
     CHINA_SPECIAL_DATES,
     CalendarResult,
@@ -37,14 +39,27 @@ class TestMarket:
         assert Market.LBMA.value == "lbma"
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _isolated_calendar_cache_dir(tmp_path_factory):
+    """把日历磁盘缓存目录指向临时目录，避免读写 ~/.fund-tui 中的残留数据"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            trading_calendar_source,
+            "CALENDAR_CACHE_DIR",
+            tmp_path_factory.mktemp("calendar_cache"),
+        )
+        yield
+
+
+@pytest.fixture(scope="module")
+def calendar_source():
+    """返回模块内共享的交易日历源实例，需修改实例状态的用例通过 patch/monkeypatch 还原"""
+    return TradingCalendarSource(timeout=5.0)
+
+
 class TestTradingCalendarSource:
     """交易日历源测试"""
 
-    @pytest.fixture
-    def calendar_source(self):
-        """返回交易日历源实例"""
-        return TradingCalendarSource(timeout=5.0)
-
     def test_init(self, calendar_source):
         """测试初始化"""
         assert calendar_source.name == "trading_calendar"
@@ -68,11 +83,26 @@ class TestTradingCalendarSource:
     def test_get_holidays(self, calendar_source):
         """测试获取节假日"""
         holidays = calendar_source._get_holidays(Market.CHINA, 2024)
-        assert isinstance(holidays, set)
+        assert isinstance(holidays, frozenset)
 
         # 美国节假日
         us_holidays = calendar_source._get_holidays(Market.USA, 2024)
-        assert isinstance(us_holidays, set)
+        assert isinstance(us_holidays, frozenset)
+
+        # 同一 (市场, 年份) 复用缓存的集合
+        assert calendar_source._get_holidays(Market.CHINA, 2024) is holidays
+
+    def test_get_holidays_failure_not_cached(self, calendar_source, monkeypatch):
+        """测试节假日库异常时回退为空集合，且失败结果不会被进程内缓存"""
+        with monkeypatch.context() as mp:
+            mp.setattr(
+                trading_calendar_source,
+                "_country_holidays",
+                MagicMock(side_effect=RuntimeError("holidays unavailable")),
+            )
+            assert calendar_source._get_holidays(Market.UK, 2040) == frozenset()
+
+        assert date(2040, 12, 25) in calendar_source._get_holidays(Market.UK, 2040)
 
     def test_get_special_dates(self, calendar_source):
         """测试获取特殊日期"""
@@ -86,10 +116,28 @@ class TestTradingCalendarSource:
             date(2024, 2, 10): "春节",
             date(2024, 5, 1): "劳动节",
         }
-        update_china_special_dates(test_dates)
+        original = dict(CHINA_SPECIAL_DATES)
+        try:
+            update_china_special_dates(test_dates)
 
-        # 验证已更新
-        assert date(2024, 2, 10) in CHINA_SPECIAL_DATES
+            # 验证已更新
+            assert date(2024, 2, 10) in CHINA_SPECIAL_DATES
+        finally:
+            # 还原模块级特殊日期，避免影响其他用例
+            CHINA_SPECIAL_DATES.clear()
+            CHINA_SPECIAL_DATES.update(original)
+
+    def test_china_makeup_day(self, monkeypatch):
+        """测试特殊日期中的补班日被标记"""
+        source = TradingCalendarSource()
+        monkeypatch.setattr(source, "_fetch_china_real_trading_days", lambda year: set())
+        monkeypatch.setitem(CHINA_SPECIAL_DATES, date(2032, 2, 7), "春节补班")
+
+        days = {d.date: d for d in source.get_calendar(Market.CHINA, 2032).trading_days}
+
+        assert days[date(2032, 2, 7)].is_makeup_day is True
+        assert days[date(2032, 2, 7)].holiday_name == "春节补班"
+        assert days[date(2032, 2, 14)].is_makeup_day is False
 
     def test_next_day(self, calendar_source):
         """测试获取下一天"""
@@ -114,6 +162,11 @@ class TestTradingCalendarSource:
         assert len(result.trading_days) > 0
         # 加密货币每天都交易
         assert result.total_trading_days == 366  # 2024是闰年
+        assert all(d.is_trading_day for d in result.trading_days)
+        assert result.trading_days[-1].date == date(2024, 12, 31)
+
+        # 再次获取命中缓存
+        assert calendar_source._get_crypto_calendar(2024) is result
 
     def test_is_trading_day_china(self, calendar_source):
         """测试判断中国股市是否交易"""
@@ -142,16 +195,45 @@ class TestTradingCalendarSource:
         assert result.year == 2024
         assert result.total_holidays == 0
 
-    def test_get_calendar_with_cache(self, calendar_source):
+    def test_get_calendar_with_cache(self, calendar_source, monkeypatch):
         """测试日历缓存"""
         # 第一次获取
         result1 = calendar_source.get_calendar(Market.JAPAN, 2024)
 
-        # 第二次获取应该使用缓存
+        # 第二次获取应该直接命中缓存，不再重建日历
+        build = MagicMock(side_effect=AssertionError("calendar rebuilt"))
+        monkeypatch.setattr(calendar_source, "_get_holidays", build)
         result2 = calendar_source.get_calendar(Market.JAPAN, 2024)
 
-        assert result1.year == result2.year
-        assert result1.market == result2.market
+        assert result2 is result1
+        build.assert_not_called()
+
+    def test_china_real_trading_days_disk_cache(self, calendar_source, tmp_path, monkeypatch):
+        """测试A股真实交易日写入磁盘缓存，并在新进程（清空内存缓存）中直接复用"""
+        year = 2031
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "data": {"klines": [f"{year}-01-02,1,2,3,4", f"{year}-01-03,1,2,3,4"]}
+        }
+        monkeypatch.setattr(calendar_source, "_disk_cache", DataCache(tmp_path))
+        TradingCalendarSource._china_real_trading_days.pop(year, None)
+
+        try:
+            with patch(
+                "src.datasources.trading_calendar_source.httpx.get", return_value=mock_response
+            ):
+                days = calendar_source._fetch_china_real_trading_days(year)
+            assert days == {date(year, 1, 2), date(year, 1, 3)}
+
+            # 模拟新进程：内存缓存清空，磁盘缓存命中时不再请求接口
+            TradingCalendarSource._china_real_trading_days.pop(year, None)
+            new_source = TradingCalendarSource()
+            new_source._disk_cache = DataCache(tmp_path)
+            with patch("src.datasources.trading_calendar_source.httpx.get") as mock_get:
+                assert new_source._fetch_china_real_trading_days(year) == days
+            mock_get.assert_not_called()
+        finally:
+            TradingCalendarSource._china_real_trading_days.pop(year, None)
 
     def test_get_calendar_by_string(self, calendar_source):
         """测试通过字符串获取日历"""
@@ -166,6 +248,21 @@ class TestTradingCalendarSource:
         assert next_day >= friday
         assert calendar_source.is_trading_day(Market.CHINA, next_day)
 
+    def test_get_next_trading_day_across_month_and_year(self, calendar_source):
+        """测试跨月、跨年查找下一个交易日"""
+        # 2024-08-31 周六，9 月 2 日为劳动节
+        assert calendar_source.get_next_trading_day(Market.USA, date(2024, 8, 31)) == date(
+            2024, 9, 3
+        )
+        # 2023-12-30 周六，2024-01-01 为元旦
+        assert calendar_source.get_next_trading_day(Market.USA, date(2023, 12, 30)) == date(
+            2024, 1, 2
+        )
+        # 交易日本身即为结果
+        assert calendar_source.get_next_trading_day(Market.USA, date(2024, 1, 2)) == date(
+            2024, 1, 2
+        )
+
     def test_get_market_status(self, calendar_source):
         """测试获取市场状态"""
         status = calendar_source.get_market_status([Market.CHINA, Market.USA])
@@ -184,29 +281,24 @@ class TestTradingCalendarSource:
             assert "is_open" in market_status
             assert "date" in market_status
 
-    def test_is_within_trading_hours(self, calendar_source):
-        """测试交易时间判断"""
-        # 测试中国股市交易时间
-        with patch.object(calendar_source, "is_trading_day", return_value=True):
-            # 交易时间内 (10:00)
-            dt = datetime(2024, 1, 15, 10, 0)
-            result = calendar_source.is_within_trading_hours(Market.CHINA, dt)
-            assert result["status"] == "open"
-
-            # 盘前 (9:00)
-            dt = datetime(2024, 1, 15, 9, 0)
-            result = calendar_source.is_within_trading_hours(Market.CHINA, dt)
-            assert result["status"] == "pre_market"
-
-            # 盘后 (15:30)
-            dt = datetime(2024, 1, 15, 15, 30)
-            result = calendar_source.is_within_trading_hours(Market.CHINA, dt)
-            assert result["status"] == "closed"
-
-            # 午间休市 (12:00)
-            dt = datetime(2024, 1, 15, 12, 0)
-            result = calendar_source.is_within_trading_hours(Market.CHINA, dt)
-            assert result["status"] == "break"
+    @pytest.mark.parametrize(
+        "hour, minute, expected_status",
+        [
+            (10, 0, "open"),  # 交易时间内
+            (9, 0, "pre_market"),  # 盘前
+            (15, 30, "closed"),  # 盘后
+            (12, 0, "break"),  # 午间休市
+        ],
+    )
+    def test_is_within_trading_hours(
+        self, calendar_source, monkeypatch, hour, minute, expected_status
+    ):
+        """测试中国股市交易时间判断"""
+        monkeypatch.setattr(calendar_source, "is_trading_day", lambda *args, **kwargs: True)
+
+        dt = datetime(2024, 1, 15, hour, minute)
+        result = calendar_source.is_within_trading_hours(Market.CHINA, dt)
+        assert result["status"] == expected_status
 
     def test_is_within_trading_hours_non_trading_day(self, calendar_source):
         """测试非交易日"""
@@ -353,6 +445,8 @@ class TestTradingDay:
         assert day.holiday_name is None
         assert day.is_makeup_day is False
         assert day.market == "china"
+        # 使用 __slots__，不分配实例 __dict__
+        assert not hasattr(day, "__dict__")
 
 
 class TestCalendarResult:
@@ -379,3 +473,24 @@ class TestCalendarResult:
         assert len(result.trading_days) == 3
         assert result.total_trading_days == 2
         assert result.total_holidays == 1
+
+    def test_is_trading_date(self):
+        """测试按位图判断交易日"""
+        result = CalendarResult(
+            year=2024,
+            market="china",
+            trading_days=[
+                TradingDay(date(2024, 1, 1), False, "元旦"),
+                TradingDay(date(2024, 1, 2), True),
+                TradingDay(date(2024, 1, 3), True),
+            ],
+            total_trading_days=2,
+            total_holidays=1,
+        )
+
+        assert result.is_trading_date(date(2024, 1, 1)) is False
+        assert result.is_trading_date(date(2024, 1, 2)) is True
+        assert result.is_trading_date(date(2024, 1, 3)) is True
+        # 日历范围之外
+        assert result.is_trading_date(date(2023, 12, 31)) is False
+        assert result.is_trading_date(date(2024, 1, 4)) is False
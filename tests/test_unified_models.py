@@ -4,6 +4,8 @@
 测试统一数据模型
 """
 
+import os
+
 from src.datasources.base import DataSourceType
 from src.datasources.unified_models import (
     BatchDataRequest,
@@ -12,6 +14,7 @@ from src.datasources.unified_models import (
     DataResponse,
     RequestPriority,
     ResponseStatus,
+    next_request_id,
 )
 
 
@@ -57,6 +60,22 @@ class TestDataRequest:
         assert request.priority == RequestPriority.NORMAL
         assert request.allow_fallback is True
 
+    def test_data_request_ids_unique(self):
+        """测试请求 ID 在进程内唯一"""
+        ids = {
+            DataRequest(symbol="000001", source_type=DataSourceType.FUND).request_id
+            for _ in range(1000)
+        }
+        assert len(ids) == 1000
+
+    def test_request_id_uses_current_pid(self, monkeypatch):
+        """测试请求 ID 前缀取调用时的 PID（fork 后的子进程不与父进程重复）"""
+        monkeypatch.setattr(os, "getpid", lambda: 0xABC)
+        assert next_request_id().startswith("abc-")
+
+        monkeypatch.setattr(os, "getpid", lambda: 0xDEF)
+        assert next_request_id().startswith("def-")
+
     def test_data_request_with_priority(self):
         """测试指定优先级"""
         request = DataRequest(
@@ -618,6 +618,16 @@ class TestWebSocketManagerInfo:
             assert manager.get_subscribers_count("indices") == 1
             assert manager.get_subscribers_count("commodities") == 0
 
+    @pytest.mark.asyncio
+    async def test_get_subscribers(self, manager, mock_websocket):
+        """测试获取订阅者 ID 集合"""
+        assert manager.get_subscribers("funds") == frozenset()
+
+        async with manager.connection(mock_websocket) as client:
+            await manager.subscribe(client.client_id, "funds")
+
+            assert manager.get_subscribers("funds") == frozenset({client.client_id})
+
     def test_get_clients_info_empty(self, manager):
         """测试空客户端信息"""
         assert manager.get_clients_info() == []